@@ -81,6 +81,7 @@ class CustomToolsManager:
         
         # Create file path
         file_path = os.path.join(self.tools_dir, category, filename)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
         # Write code to file
         with open(file_path, 'w') as f:
@@ -169,19 +170,25 @@ class CustomToolsManager:
     
     def delete_tool(self, tool_id: int) -> bool:
         """Delete a custom tool"""
-        tool = next((t for t in self.tools["tools"] if t["id"] == tool_id), None)
-        if not tool:
-            return False
+        return self.bulk_delete([tool_id]) > 0
+    
+    def bulk_delete(self, tool_ids: list) -> int:
+        """Delete several tools, saving the database once; returns how many were removed"""
+        ids = set(tool_ids)
+        removed = [t for t in self.tools["tools"] if t["id"] in ids]
+        if not removed:
+            return 0
         
-        # Remove file
-        if os.path.exists(tool["file_path"]):
-            os.remove(tool["file_path"])
+        # Remove files
+        for tool in removed:
+            if os.path.exists(tool["file_path"]):
+                os.remove(tool["file_path"])
         
         # Remove from database
-        self.tools["tools"] = [t for t in self.tools["tools"] if t["id"] != tool_id]
+        self.tools["tools"] = [t for t in self.tools["tools"] if t["id"] not in ids]
         self._save_tools_db()
         
-        return True
+        return len(removed)
     
     def export_tool(self, tool_id: int) -> dict:
         """Export a tool for sharing"""
@@ -189,21 +196,31 @@ class CustomToolsManager:
         if not tool:
             return {"error": "Tool not found"}
         
+        return self._export_data(tool, datetime.now().isoformat())
+    
+    def export_all(self, tool_ids: list = None):
+        """Export several tools (all by default) in one pass over the database, yielding one at a time"""
+        wanted = set(tool_ids) if tool_ids is not None else None
+        exported_at = datetime.now().isoformat()
+        for tool in self.tools["tools"]:
+            if wanted is None or tool["id"] in wanted:
+                yield self._export_data(tool, exported_at)
+    
+    def _export_data(self, tool: dict, exported_at: str) -> dict:
+        """Export data for one tool record"""
         # Read code
         with open(tool["file_path"], 'r') as f:
             code = f.read()
         
-        export_data = {
+        return {
             "name": tool["name"],
             "description": tool["description"],
             "category": tool["category"],
             "language": tool["language"],
             "code": code,
             "args_schema": tool["args_schema"],
-            "exported_at": datetime.now().isoformat()
+            "exported_at": exported_at
         }
-        
-        return export_data
     
     def import_tool(self, import_data: dict) -> dict:
         """Import a tool from export data"""
@@ -14,6 +14,7 @@ import shutil
 from datetime import datetime
 import subprocess
 import sqlite3
+import requests
 from pathlib import Path
 from custom_tools_manager import CustomToolsManager
 from multi_agent_orchestrator import MultiAgentOrchestrator, AgentResult
@@ -905,7 +906,6 @@ if __name__ == "__main__":
             if tool_name and tool_code:
                 try:
                     # Parse args schema
-                    import json
                     parsed_args = json.loads(args_schema) if args_schema else {}
                     
                     # Create tool
@@ -1172,7 +1172,6 @@ def render_agent_control():
             
             if selected_agent and task_config:
                 try:
-                    import json
                     task_data = json.loads(task_config)
                     tasks.append({"agent": selected_agent, "data": task_data})
                 except:
@@ -1231,32 +1230,17 @@ def render_agent_control():
             if feature_request:
                 with st.spinner("🏭 Running complete feature pipeline..."):
                     
-                    # Show pipeline progress
+                    # Show pipeline progress as each phase actually finishes
                     progress_bar = st.progress(0)
                     status_text = st.empty()
-                    
-                    # Phase 1: Planning
                     status_text.text("🧠 Phase 1: Planning and analysis...")
-                    progress_bar.progress(20)
-                    
-                    # Phase 2: Implementation 
-                    status_text.text("🔧 Phase 2: Code generation and refactoring...")
-                    progress_bar.progress(40)
-                    
-                    # Phase 3: Testing
-                    status_text.text("🧪 Phase 3: Test generation...")
-                    progress_bar.progress(60)
-                    
-                    # Phase 4: Documentation
-                    status_text.text("📖 Phase 4: Documentation generation...")
-                    progress_bar.progress(80)
                     
-                    # Phase 5: Review
-                    status_text.text("👥 Phase 5: Quality review...")
-                    progress_bar.progress(100)
+                    def on_progress(done, total, phase):
+                        progress_bar.progress(int(done / total * 100))
+                        status_text.text(f"✅ {phase} done ({done}/{total})")
                     
                     # Run the actual pipeline
-                    success = st.session_state.orchestrator.run_feature_pipeline(feature_request)
+                    success = st.session_state.orchestrator.run_feature_pipeline(feature_request, on_progress=on_progress)
                     
                     if success:
                         st.success("🎉 Feature pipeline completed successfully!")
@@ -1339,7 +1323,7 @@ def render_agent_control():
             # Recent executions
             st.markdown("**🕒 Recent Executions:**")
             
-            for result in reversed(st.session_state.orchestrator.results[-10:]):  # Last 10
+            for result in st.session_state.orchestrator.recent_results(10):
                 with st.expander(f"{'✅' if result.success else '❌'} {result.agent_name} - {result.timestamp[:19]}"):
                     st.text(f"Agent: {result.agent_name}")
                     st.text(f"Status: {'Success' if result.success else 'Failed'}")
@@ -1356,7 +1340,7 @@ def render_agent_control():
             
             # Clear history
             if st.button("🗑️ Clear History"):
-                st.session_state.orchestrator.results = []
+                st.session_state.orchestrator.clear_results()
                 st.success("✅ Execution history cleared")
                 st.rerun()
         
@@ -1740,7 +1724,6 @@ def main():
         if st.button("Send") and user_input:
             with st.spinner("🤖 Thinking..."):
                 try:
-                    import requests
                     response = requests.post(
                         "http://localhost:11434/api/generate",
                         json={"model": "llama3", "prompt": user_input},
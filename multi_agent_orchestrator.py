@@ -7,9 +7,21 @@ Spawns and coordinates specialized agents in parallel
 import os
 import json
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Dict, Any, Iterator, Callable, Optional
+
+# Results kept for the history views; older ones still count toward the summary totals
+RESULTS_HISTORY_SIZE = 1000
+
+# Latest results listed in get_summary(); the totals still cover every run
+SUMMARY_RESULTS_LIMIT = 20
+
+# Threads shared by all single-agent runs; each one just waits on an agent subprocess
+AGENT_WORKERS = 8
 
 class AgentResult:
     def __init__(self, agent_name: str, success: bool, output: str, artifacts: List[str] = None):
@@ -23,15 +35,33 @@ class MultiAgentOrchestrator:
     def __init__(self, workspace_path: str = "."):
         self.workspace_path = workspace_path
         self.agents = {}
-        self.results = []
+        self.results = deque(maxlen=RESULTS_HISTORY_SIZE)
+        self.total_runs = 0
+        self.successful_runs = 0
+        self._results_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=AGENT_WORKERS)
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
         
     def register_agent(self, name: str, script_path: str, description: str):
         """Register a specialized agent"""
+        # Re-registering an unchanged, active agent is a no-op, so callers can register on every run
+        current = self.agents.get(name)
+        if current and current["active"] and current["script"] == script_path and current["description"] == description:
+            return
+        
         self.agents[name] = {
             "script": script_path,
             "description": description,
             "active": os.path.exists(script_path)
         }
+    
+    def get_registered_agents(self) -> Dict[str, Dict[str, Any]]:
+        """Describe each registered agent and whether its script was found"""
+        return {
+            name: {"description": info["description"], "healthy": info["active"]}
+            for name, info in self.agents.items()
+        }
         
     def spawn_agent(self, agent_name: str, task_data: Dict[str, Any]) -> AgentResult:
         """Spawn a single agent with task data"""
@@ -66,6 +96,45 @@ class MultiAgentOrchestrator:
             print(f"⚠️ {agent_name} error: {e}")
             return AgentResult(agent_name, False, str(e))
     
+    def run_single_agent(self, agent_name: str, context: str) -> AgentResult:
+        """Run one agent on a free-form request and record the result"""
+        result = self.spawn_agent(agent_name, {"request": context, "workspace": self.workspace_path})
+        self._record(result)
+        return result
+    
+    def run_agent_pipeline(self, agent_names: List[str], context: str) -> List[AgentResult]:
+        """Run agents one after another on the same request, returning their results in order"""
+        print(f"🔄 Running {len(agent_names)} agents in sequence...")
+        return [self.run_single_agent(name, context) for name in agent_names]
+    
+    def submit_single_agent(self, agent_name: str, context: str) -> Future:
+        """Start run_single_agent in the background, joining an identical run that is still in flight"""
+        key = (agent_name, context)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = self._executor.submit(self.run_single_agent, agent_name, context)
+            self._inflight[key] = future
+        
+        # Added outside the lock: it runs immediately if the agent has already finished
+        future.add_done_callback(lambda done: self._forget_inflight(key, done))
+        return future
+    
+    def _forget_inflight(self, key, future: Future):
+        """Drop a finished run so the next identical request starts a fresh one"""
+        with self._inflight_lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+    
+    def run_agent_pipeline_parallel(self, agent_names: List[str], context: str) -> Iterator[AgentResult]:
+        """Run independent agents on the same request at once, yielding each result as it finishes"""
+        print(f"🎼 Running {len(agent_names)} agents in parallel...")
+        
+        futures = [self.submit_single_agent(name, context) for name in agent_names]
+        for future in as_completed(futures):
+            yield future.result()
+    
     def orchestrate_parallel(self, tasks: List[Dict[str, Any]]) -> List[AgentResult]:
         """Run multiple agents in parallel"""
         print(f"🎼 Orchestrating {len(tasks)} agents in parallel...")
@@ -80,14 +149,18 @@ class MultiAgentOrchestrator:
             for future in as_completed(futures):
                 result = future.result()
                 results.append(result)
-                self.results.append(result)
+                self._record(result)
         
         return results
     
-    def run_feature_pipeline(self, feature_request: str) -> bool:
+    def run_feature_pipeline(self, feature_request: str,
+                             on_progress: Optional[Callable[[int, int, str], None]] = None) -> bool:
         """Complete pipeline: Plan -> Code -> Test -> Doc -> Review"""
         print(f"🚀 Starting feature pipeline: {feature_request}")
         
+        # on_progress(done, total, phase) is called after each of the three phases finishes
+        report = on_progress or (lambda done, total, phase: None)
+        
         # Phase 1: Planning
         planning_tasks = [{
             "agent": "planner",
@@ -95,6 +168,7 @@ class MultiAgentOrchestrator:
         }]
         
         planning_results = self.orchestrate_parallel(planning_tasks)
+        report(1, 3, "Planning")
         if not all(r.success for r in planning_results):
             print("❌ Planning phase failed")
             return False
@@ -107,6 +181,7 @@ class MultiAgentOrchestrator:
         ]
         
         impl_results = self.orchestrate_parallel(implementation_tasks)
+        report(2, 3, "Implementation")
         
         # Phase 3: Review
         review_tasks = [{
@@ -115,6 +190,7 @@ class MultiAgentOrchestrator:
         }]
         
         review_results = self.orchestrate_parallel(review_tasks)
+        report(3, 3, "Review")
         
         all_success = all(r.success for r in impl_results + review_results)
         
@@ -125,10 +201,33 @@ class MultiAgentOrchestrator:
             
         return all_success
     
+    def _record(self, result: AgentResult):
+        """Keep a result for the history views and count it toward the summary"""
+        with self._results_lock:
+            self.results.append(result)
+            self.total_runs += 1
+            if result.success:
+                self.successful_runs += 1
+    
+    def recent_results(self, count: int) -> List[AgentResult]:
+        """Get the latest results, newest first"""
+        with self._results_lock:
+            items = list(self.results)
+        return list(islice(reversed(items), count))
+    
+    def clear_results(self):
+        """Forget all recorded results and reset the summary totals"""
+        with self._results_lock:
+            self.results.clear()
+            self.total_runs = 0
+            self.successful_runs = 0
+    
     def get_summary(self) -> Dict[str, Any]:
         """Get execution summary"""
-        total = len(self.results)
-        successful = sum(1 for r in self.results if r.success)
+        with self._results_lock:
+            total = self.total_runs
+            successful = self.successful_runs
+            items = list(self.results)
         
         return {
             "total_agents": total,
@@ -140,7 +239,7 @@ class MultiAgentOrchestrator:
                     "agent": r.agent_name,
                     "success": r.success,
                     "timestamp": r.timestamp
-                } for r in self.results
+                } for r in items[-SUMMARY_RESULTS_LIMIT:]
             ]
         }
 
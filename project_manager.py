@@ -12,6 +12,80 @@ import tempfile
 from datetime import datetime
 from pathlib import Path
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _dumps_indented(obj) -> str:
+    """Serialize to 2-space indented JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+def _write_file_bytes(item):
+    """Write a (path, data) pair with a single open and close"""
+    path, data = item
+    view = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write only part of the buffer, so keep going until it is all out
+        while view.nbytes:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+# tsconfig.json is identical for every project, so serialize it once
+TSCONFIG_JSON = _dumps_indented({
+    "compilerOptions": {
+        "target": "ES2020",
+        "module": "commonjs",
+        "outDir": "./dist",
+        "rootDir": "./src",
+        "strict": True,
+        "esModuleInterop": True,
+        "skipLibCheck": True,
+        "forceConsistentCasingInFileNames": True
+    },
+    "include": ["src/**/*"],
+    "exclude": ["node_modules", "dist"]
+})
+
+AI_INSTRUCTIONS_FILE = 'AI_INSTRUCTIONS.md'
+
+# Prompt words that never make it into a suggested project name
+PROJECT_NAME_STOPWORDS = frozenset({'create', 'build', 'make', 'develop', 'app', 'project'})
+
+# Python requirements per project type and per detected feature
+PYTHON_REQUIREMENTS_BY_TYPE = {
+    'web_backend': ('flask', 'requests', 'python-dotenv'),
+    'data_science': ('pandas', 'numpy', 'matplotlib', 'jupyter'),
+    'automation': ('requests', 'beautifulsoup4', 'selenium'),
+    'game': ('pygame',),
+    'desktop': ('tkinter',),
+}
+
+PYTHON_REQUIREMENTS_BY_FEATURE = {
+    'database': ('sqlite3',),
+    'testing': ('pytest', 'pytest-cov'),
+}
+
+# run_project streams stdout/stderr here and returns only the last 64 KB
+RUN_LOG_FILE = '.gringo_run.log'
+RUN_OUTPUT_TAIL_BYTES = 64 * 1024
+
+# Fallback run commands for projects whose metadata predates 'run_cmd'
+DEFAULT_RUN_COMMANDS = {
+    'python': ['python', 'main.py'],
+    'javascript': ['npm', 'start'],
+    'typescript': ['npm', 'start'],
+}
 
 class ProjectManager:
     def __init__(self, workspace_root: str):
@@ -19,6 +93,7 @@ class ProjectManager:
         self.projects_dir = os.path.join(workspace_root, "projects")
         self.templates_dir = os.path.join(workspace_root, "templates")
         self.db_path = os.path.join(workspace_root, "projects.db")
+        self._project_metadata = lru_cache(maxsize=128)(self._load_project_metadata)
         self._init_directories()
         self._init_database()
     
@@ -73,23 +148,33 @@ class ProjectManager:
         if not project_name:
             project_name = project_info.get('suggested_name', f"project_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
         
-        # Create project directory
+        # Claim the name before touching the disk, so an existing project's files are never overwritten
         project_path = os.path.join(self.projects_dir, project_name)
-        os.makedirs(project_path, exist_ok=True)
-        
-        # Generate project structure based on type
-        files_created = self._generate_project_structure(project_path, project_info)
+        project_id = self._insert_project_row(project_name, project_info, project_path)
         
-        # Save project to database
-        project_id = self._save_project_to_db(project_name, project_info, project_path)
-        
-        # Generate initial files based on prompt
-        ai_files = self._generate_ai_files(project_path, project_info, prompt)
-        files_created.extend(ai_files)
-        
-        # Create run/build scripts
-        run_scripts = self._create_run_scripts(project_path, project_info)
-        files_created.extend(run_scripts)
+        try:
+            # Create project directory
+            os.makedirs(project_path, exist_ok=True)
+            
+            # Generate project structure based on type
+            files_created = self._generate_project_structure(project_path, project_info)
+            
+            # Generate initial files based on prompt
+            ai_files = self._generate_ai_files(project_path, project_info, prompt)
+            files_created.extend(ai_files)
+            
+            # Create run/build scripts (records project_info['run_cmd'])
+            run_scripts = self._create_run_scripts(project_path, project_info)
+            files_created.extend(run_scripts)
+        except Exception:
+            # Release the name so the project can be created again
+            self._delete_project_row(project_id)
+            raise
+        
+        # Save final metadata and the files recorded as they were written to database
+        project_files = project_info.pop('file_rows', [])
+        self._save_project_to_db(project_id, project_info, project_files)
+        self._project_metadata.cache_clear()
         
         return {
             "project_id": project_id,
@@ -166,8 +251,7 @@ class ProjectManager:
     
     def _suggest_project_name(self, prompt: str, project_type: str) -> str:
         """Suggest a project name based on prompt"""
-        words = prompt.lower().split()
-        key_words = [w for w in words if len(w) > 3 and w not in ['create', 'build', 'make', 'develop', 'app', 'project']]
+        key_words = [w for w in prompt.lower().split() if len(w) > 3 and w not in PROJECT_NAME_STOPWORDS]
         
         if key_words:
             name = '_'.join(key_words[:3])
@@ -199,11 +283,20 @@ class ProjectManager:
         elif project_type == 'desktop':
             dirs_to_create.extend(['ui', 'resources', 'assets'])
         
-        # Create directories
-        for dir_name in dirs_to_create:
-            dir_path = os.path.join(project_path, dir_name)
-            os.makedirs(dir_path, exist_ok=True)
-            files_created.append(f"📁 {dir_name}/")
+        # Create directories - deepest first, skipping any already created as a parent
+        dirs_to_create = list(dict.fromkeys(dirs_to_create))
+        project_root = os.path.normpath(project_path)
+        path_prefix = project_root + os.sep
+        created_dirs = set()
+        for dir_name in sorted(dirs_to_create, key=lambda d: d.count('/'), reverse=True):
+            dir_path = path_prefix + dir_name
+            if dir_path not in created_dirs:
+                os.makedirs(dir_path, exist_ok=True)
+                while dir_path != project_root and dir_path not in created_dirs:
+                    created_dirs.add(dir_path)
+                    dir_path = os.path.dirname(dir_path)
+
+        files_created.extend(f"📁 {dir_name}/" for dir_name in dirs_to_create)
         
         # Create basic files
         if language == 'python':
@@ -217,81 +310,77 @@ class ProjectManager:
     
     def _create_python_files(self, project_path: str, project_info: dict) -> list:
         """Create Python-specific files"""
-        files = []
-        
-        # requirements.txt
-        requirements_content = self._get_python_requirements(project_info)
-        with open(os.path.join(project_path, 'requirements.txt'), 'w') as f:
-            f.write(requirements_content)
-        files.append("📄 requirements.txt")
-        
-        # main.py
-        main_content = self._get_python_main(project_info)
-        with open(os.path.join(project_path, 'main.py'), 'w') as f:
-            f.write(main_content)
-        files.append("🐍 main.py")
-        
-        # setup.py
-        setup_content = self._get_python_setup(project_info)
-        with open(os.path.join(project_path, 'setup.py'), 'w') as f:
-            f.write(setup_content)
-        files.append("⚙️ setup.py")
-        
-        # README.md
-        readme_content = self._get_readme(project_info)
-        with open(os.path.join(project_path, 'README.md'), 'w') as f:
-            f.write(readme_content)
-        files.append("📖 README.md")
-        
-        return files
+        files = [
+            ('requirements.txt', self._get_python_requirements(project_info), "📄 requirements.txt"),
+            ('main.py', self._get_python_main(project_info), "🐍 main.py"),
+            ('setup.py', self._get_python_setup(project_info), "⚙️ setup.py"),
+            ('README.md', self._get_readme(project_info), "📖 README.md"),
+        ]
+        return self._write_files(project_path, files, project_info)
     
     def _create_javascript_files(self, project_path: str, project_info: dict) -> list:
         """Create JavaScript-specific files"""
-        files = []
-        
-        # package.json
-        package_content = self._get_package_json(project_info)
-        with open(os.path.join(project_path, 'package.json'), 'w') as f:
-            f.write(package_content)
-        files.append("📦 package.json")
-        
-        # index.js or app.js
-        main_file = 'index.js' if project_info['type'] == 'web_backend' else 'app.js'
-        main_content = self._get_javascript_main(project_info)
-        with open(os.path.join(project_path, main_file), 'w') as f:
-            f.write(main_content)
-        files.append(f"📄 {main_file}")
-        
-        # README.md
-        readme_content = self._get_readme(project_info)
-        with open(os.path.join(project_path, 'README.md'), 'w') as f:
-            f.write(readme_content)
-        files.append("📖 README.md")
-        
-        return files
+        return self._write_files(project_path, self._js_file_specs(project_info), project_info)
     
     def _create_typescript_files(self, project_path: str, project_info: dict) -> list:
         """Create TypeScript-specific files"""
-        files = self._create_javascript_files(project_path, project_info)
-        
-        # tsconfig.json
-        tsconfig_content = self._get_tsconfig(project_info)
-        with open(os.path.join(project_path, 'tsconfig.json'), 'w') as f:
-            f.write(tsconfig_content)
-        files.append("⚙️ tsconfig.json")
+        # tsconfig.json compiles src/ into dist/, so the entry point lives in src/ and runs from dist/
+        entry = 'index' if project_info['type'] == 'web_backend' else 'app'
+        main_file = f'src/{entry}.ts'
+        
+        files = [
+            ('package.json', self._get_package_json(project_info, f'dist/{entry}.js'), "📦 package.json"),
+            (main_file, self._get_typescript_main(project_info), f"📘 {main_file}"),
+            ('tsconfig.json', self._get_tsconfig(project_info), "⚙️ tsconfig.json"),
+            ('README.md', self._get_readme(project_info), "📖 README.md"),
+        ]
+        return self._write_files(project_path, files, project_info)
+    
+    def _js_file_specs(self, project_info: dict) -> list:
+        """Build (filename, content, label) entries for a JavaScript project"""
+        # index.js or app.js
+        main_file = 'index.js' if project_info['type'] == 'web_backend' else 'app.js'
         
-        return files
+        return [
+            ('package.json', self._get_package_json(project_info, main_file), "📦 package.json"),
+            (main_file, self._get_javascript_main(project_info), f"📄 {main_file}"),
+            ('README.md', self._get_readme(project_info), "📖 README.md"),
+        ]
+    
+    def _write_files(self, project_path: str, files: list, project_info: dict) -> list:
+        """Write (filename, content, label) entries concurrently, recording their rows in project_info['file_rows']; returns their labels in order"""
+        # Normalize the project path once and concatenate, instead of joining per file
+        path_prefix = os.path.join(project_path, '')
+        write_plan = [(path_prefix + filename, content.encode('utf-8'))
+                      for filename, content, _ in files]
+        
+        # Small writes are bound by syscall latency, so overlap them across threads
+        if len(write_plan) == 1:
+            _write_file_bytes(write_plan[0])
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(write_plan))) as executor:
+                list(executor.map(_write_file_bytes, write_plan))
+        
+        # (filename, filepath, file_type, size, ai_generated) for the database
+        file_rows = project_info.setdefault('file_rows', [])
+        for path, data in write_plan:
+            filename = os.path.basename(path)
+            file_rows.append((
+                filename,
+                path,
+                os.path.splitext(filename)[1].lstrip('.'),
+                len(data),
+                filename == AI_INSTRUCTIONS_FILE
+            ))
+        
+        return [label for _, _, label in files]
     
     def _generate_ai_files(self, project_path: str, project_info: dict, prompt: str) -> list:
         """Generate AI-assisted files based on the prompt"""
-        files = []
-        
         # This would integrate with your LLaMA/AI system
         # For now, creating placeholder files with AI instructions
         
-        ai_instructions_file = os.path.join(project_path, 'AI_INSTRUCTIONS.md')
-        with open(ai_instructions_file, 'w') as f:
-            f.write(f"""# AI Generation Instructions
+        instructions = f"""# AI Generation Instructions
 
 ## Original Prompt
 {prompt}
@@ -314,10 +403,10 @@ class ProjectManager:
 - Test files
 - Documentation
 - Deployment scripts
-""")
-        files.append("🤖 AI_INSTRUCTIONS.md")
-        
-        return files
+"""
+        return self._write_files(
+            project_path, [(AI_INSTRUCTIONS_FILE, instructions, f"🤖 {AI_INSTRUCTIONS_FILE}")], project_info
+        )
     
     def _create_run_scripts(self, project_path: str, project_info: dict) -> list:
         """Create run and build scripts"""
@@ -331,61 +420,43 @@ class ProjectManager:
 {project_info.get('description', 'Project runner')}
 '''
 
-import sys
 import os
-
-def main():
-    print("🚀 Starting {os.path.basename(os.getcwd())}...")
-    
-    # Add your startup logic here
-    from main import main as app_main
-    app_main()
+import sys
 
 if __name__ == "__main__":
-    main()
+    print("🚀 Starting {os.path.basename(project_path)}...", flush=True)
+    
+    # Replace this process with main.py rather than importing it
+    main_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+    os.execv(sys.executable, [sys.executable, main_script] + sys.argv[1:])
 """
-            with open(os.path.join(project_path, 'run.py'), 'w') as f:
-                f.write(run_content)
-            files.append("🚀 run.py")
+            files.extend(self._write_files(project_path, [('run.py', run_content, "🚀 run.py")], project_info))
+            project_info['run_cmd'] = ['python', 'run.py']
             
-        elif language == 'javascript':
-            # Create npm scripts in package.json (already done)
-            pass
+        elif language in ('javascript', 'typescript'):
+            # Create npm scripts in package.json (already done; TypeScript builds on prestart)
+            project_info['run_cmd'] = DEFAULT_RUN_COMMANDS[language]
         
         # Universal run script
         if os.name == 'posix':  # Unix-like systems
-            run_script = os.path.join(project_path, 'run.sh')
-            with open(run_script, 'w') as f:
-                if language == 'python':
-                    f.write("#!/bin/bash\npython run.py\n")
-                elif language == 'javascript':
-                    f.write("#!/bin/bash\nnpm start\n")
-            os.chmod(run_script, 0o755)
-            files.append("🔧 run.sh")
+            if language == 'python':
+                run_sh = "#!/bin/bash\nexec python main.py\n"
+            elif language in ('javascript', 'typescript'):
+                run_sh = "#!/bin/bash\nexec npm start\n"
+            else:
+                run_sh = ""
+            files.extend(self._write_files(project_path, [('run.sh', run_sh, "🔧 run.sh")], project_info))
+            os.chmod(os.path.join(project_path, 'run.sh'), 0o755)
         
         return files
     
     def _get_python_requirements(self, project_info: dict) -> str:
         """Generate Python requirements based on project type"""
-        base_requirements = []
+        requirements = PYTHON_REQUIREMENTS_BY_TYPE.get(project_info['type'], ())
+        for feature in project_info['features']:
+            requirements += PYTHON_REQUIREMENTS_BY_FEATURE.get(feature, ())
         
-        if project_info['type'] == 'web_backend':
-            base_requirements.extend(['flask', 'requests', 'python-dotenv'])
-        elif project_info['type'] == 'data_science':
-            base_requirements.extend(['pandas', 'numpy', 'matplotlib', 'jupyter'])
-        elif project_info['type'] == 'automation':
-            base_requirements.extend(['requests', 'beautifulsoup4', 'selenium'])
-        elif project_info['type'] == 'game':
-            base_requirements.extend(['pygame'])
-        elif project_info['type'] == 'desktop':
-            base_requirements.extend(['tkinter'])
-        
-        if 'database' in project_info['features']:
-            base_requirements.append('sqlite3')
-        if 'testing' in project_info['features']:
-            base_requirements.extend(['pytest', 'pytest-cov'])
-        
-        return '\n'.join(base_requirements)
+        return '\n'.join(requirements)
     
     def _get_python_main(self, project_info: dict) -> str:
         """Generate main Python file"""
@@ -411,24 +482,64 @@ if __name__ == "__main__":
     main()
 '''
     
-    def _get_package_json(self, project_info: dict) -> str:
-        """Generate package.json for JavaScript projects"""
-        return json.dumps({
-            "name": project_info.get('suggested_name', 'new-project'),
-            "version": "1.0.0",
-            "description": project_info.get('description', ''),
-            "main": "index.js",
-            "scripts": {
-                "start": "node index.js",
-                "dev": "nodemon index.js",
+    def _get_package_json(self, project_info: dict, main: str = 'index.js') -> str:
+        """Generate package.json for JavaScript and TypeScript projects, running main"""
+        if project_info['language'] == 'typescript':
+            # npm start compiles src/ with tsc first, then runs the compiled entry point
+            scripts = {
+                "build": "tsc",
+                "prestart": "npm run build",
+                "start": f"node {main}",
+                "dev": "tsc --watch",
                 "test": "jest"
-            },
-            "dependencies": self._get_js_dependencies(project_info),
-            "devDependencies": {
+            }
+            dev_dependencies = {
+                "typescript": "^5.0.0",
+                "@types/node": "^20.0.0",
+                "jest": "^28.0.0"
+            }
+        else:
+            scripts = {
+                "start": f"node {main}",
+                "dev": f"nodemon {main}",
+                "test": "jest"
+            }
+            dev_dependencies = {
                 "nodemon": "^2.0.0",
                 "jest": "^28.0.0"
             }
-        }, indent=2)
+        
+        return _dumps_indented({
+            "name": project_info.get('suggested_name', 'new-project'),
+            "version": "1.0.0",
+            "description": project_info.get('description', ''),
+            "main": main,
+            "scripts": scripts,
+            "dependencies": self._get_js_dependencies(project_info),
+            "devDependencies": dev_dependencies
+        })
+    
+    def _get_typescript_main(self, project_info: dict) -> str:
+        """Generate the main TypeScript file"""
+        return f'''/**
+ * {project_info.get('description', 'Main application file')}
+ *
+ * Project Type: {project_info['type']}
+ * Language: {project_info['language']}
+ * Features: {', '.join(project_info['features'])}
+ */
+
+function main(): void {{
+    console.log("🚀 Starting application...");
+
+    // TODO: Implement your application logic here
+    // This is generated based on your prompt: {project_info.get('description', '')}
+
+    console.log("✅ Application setup complete!");
+}}
+
+main();
+'''
     
     def _get_js_dependencies(self, project_info: dict) -> dict:
         """Get JavaScript dependencies based on project type"""
@@ -487,20 +598,7 @@ cd {project_info.get('suggested_name', 'project')}
     
     def _get_tsconfig(self, project_info: dict) -> str:
         """Generate TypeScript configuration"""
-        return json.dumps({
-            "compilerOptions": {
-                "target": "ES2020",
-                "module": "commonjs",
-                "outDir": "./dist",
-                "rootDir": "./src",
-                "strict": True,
-                "esModuleInterop": True,
-                "skipLibCheck": True,
-                "forceConsistentCasingInFileNames": True
-            },
-            "include": ["src/**/*"],
-            "exclude": ["node_modules", "dist"]
-        }, indent=2)
+        return TSCONFIG_JSON
     
     def _get_next_steps(self, project_type: str, language: str) -> list:
         """Get recommended next steps for the project"""
@@ -524,96 +622,124 @@ cd {project_info.get('suggested_name', 'project')}
         
         return steps
     
-    def _save_project_to_db(self, name: str, project_info: dict, path: str) -> int:
-        """Save project information to database"""
+    def _insert_project_row(self, name: str, project_info: dict, path: str) -> int:
+        """Insert a new project's row, raising ValueError if the name is already taken"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.execute('''
+                INSERT INTO projects (name, type, description, path, metadata)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (
+                name,
+                project_info['type'],
+                project_info.get('description', ''),
+                path,
+                json.dumps(project_info)
+            ))
+            conn.commit()
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Project '{name}' already exists")
+        finally:
+            conn.close()
+        
+        return cursor.lastrowid
+    
+    def _delete_project_row(self, project_id: int):
+        """Remove a project row and its file rows"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('DELETE FROM project_files WHERE project_id = ?', (project_id,))
+        conn.execute('DELETE FROM projects WHERE id = ?', (project_id,))
+        conn.commit()
+        conn.close()
+    
+    def _save_project_to_db(self, project_id: int, project_info: dict, project_files: list = None):
+        """Save a created project's final metadata and its files to database"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute('''
-            INSERT INTO projects (name, type, description, path, metadata)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
-            name,
-            project_info['type'],
-            project_info.get('description', ''),
-            path,
-            json.dumps(project_info)
-        ))
-        
-        project_id = cursor.lastrowid
+            UPDATE projects SET metadata = ?, last_updated = CURRENT_TIMESTAMP
+            WHERE id = ?
+        ''', (json.dumps(project_info), project_id))
+        
+        if project_files:
+            cursor.executemany('''
+                INSERT INTO project_files (project_id, filename, filepath, file_type, size, ai_generated)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', [(project_id, *file_row) for file_row in project_files])
+        
         conn.commit()
         conn.close()
-        
-        return project_id
     
     def list_projects(self) -> list:
         """List all projects"""
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn.row_factory = sqlite3.Row
         
-        cursor.execute('''
+        cursor = conn.execute('''
             SELECT id, name, type, description, path, status, created_at
             FROM projects
             ORDER BY last_updated DESC
         ''')
-        
-        projects = []
-        for row in cursor.fetchall():
-            projects.append({
-                'id': row[0],
-                'name': row[1],
-                'type': row[2],
-                'description': row[3],
-                'path': row[4],
-                'status': row[5],
-                'created_at': row[6]
-            })
+        projects = [dict(row) for row in cursor]
         
         conn.close()
         return projects
     
-    def run_project(self, project_name: str) -> dict:
-        """Run a project"""
+    def _load_project_metadata(self, project_name: str) -> MappingProxyType:
+        """Load a project's parsed metadata plus its path (cached via _project_metadata)"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        cursor.execute('SELECT path, type, metadata FROM projects WHERE name = ?', (project_name,))
+        cursor.execute('SELECT path, metadata FROM projects WHERE name = ?', (project_name,))
         result = cursor.fetchone()
         conn.close()
         
+        # Raise rather than return None so misses are never cached
         if not result:
-            return {"error": "Project not found"}
+            raise LookupError(project_name)
         
-        project_path, project_type, metadata_json = result
+        project_path, metadata_json = result
         metadata = json.loads(metadata_json)
+        metadata['path'] = project_path
+        return MappingProxyType(metadata)
+    
+    def run_project(self, project_name: str) -> dict:
+        """Run a project"""
+        try:
+            metadata = self._project_metadata(project_name)
+        except LookupError:
+            return {"error": "Project not found"}
+        
+        project_path = metadata['path']
         language = metadata.get('language', 'python')
         
-        # Determine run command
-        if language == 'python':
-            run_file = os.path.join(project_path, 'run.py')
-            if os.path.exists(run_file):
-                cmd = ['python', run_file]
-            else:
-                cmd = ['python', 'main.py']
-        elif language == 'javascript':
-            cmd = ['npm', 'start']
-        else:
+        # Run command is resolved at creation time; fall back for older projects
+        cmd = metadata.get('run_cmd') or DEFAULT_RUN_COMMANDS.get(language)
+        if not cmd:
             return {"error": f"Don't know how to run {language} projects"}
         
+        log_path = os.path.join(project_path, RUN_LOG_FILE)
         try:
-            # Change to project directory and run
-            result = subprocess.run(
-                cmd,
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            # Change to project directory and run, streaming output to the run log
+            with open(log_path, 'wb+') as log_file:
+                result = subprocess.run(
+                    cmd,
+                    cwd=project_path,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    timeout=30
+                )
+                
+                # Only the tail of the log is returned, so memory stays bounded
+                log_size = log_file.tell()
+                log_file.seek(max(0, log_size - RUN_OUTPUT_TAIL_BYTES))
+                output = log_file.read().decode('utf-8', 'replace')
             
             return {
                 "success": True,
-                "output": result.stdout,
-                "errors": result.stderr,
+                "output": output,
+                "log_file": log_path,
                 "return_code": result.returncode
             }
             
@@ -624,18 +750,11 @@ cd {project_info.get('suggested_name', 'project')}
     
     def export_project(self, project_name: str, export_path: str = None) -> str:
         """Export project as zip file"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT path FROM projects WHERE name = ?', (project_name,))
-        result = cursor.fetchone()
-        conn.close()
-        
-        if not result:
+        try:
+            project_path = self._project_metadata(project_name)['path']
+        except LookupError:
             raise ValueError("Project not found")
         
-        project_path = result[0]
-        
         if not export_path:
             export_path = f"{project_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
         
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by setup.py and setup_gringo.py for running setup probes in a process pool
+"""
+
+import io
+from contextlib import redirect_stdout
+
+def run_captured(func, *args):
+    """Run func in a pool worker, returning (result, printed output)"""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        result = func(*args)
+    return result, buffer.getvalue()
+
+def collect(future):
+    """Print a captured probe's output in order and return its result"""
+    result, output = future.result()
+    print(output, end='')
+    return result
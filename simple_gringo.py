@@ -5,29 +5,19 @@ SIMPLE GRINGO Personal OS - Working Version Without Complex Dependencies
 
 import streamlit as st
 import os
-import sys
-import json
+import shlex
+import asyncio
 import subprocess
+from collections import deque
+from itertools import islice
 from datetime import datetime
-import tempfile
-import sqlite3
+from pathlib import Path
 
-# Simple classes to avoid import issues
-class SimpleProjectManager:
-    def __init__(self, workspace_root: str):
-        self.workspace_root = workspace_root
-        self.projects_dir = os.path.join(workspace_root, "projects")
-        os.makedirs(self.projects_dir, exist_ok=True)
-    
-    def create_simple_project(self, name: str, project_type: str, description: str):
-        """Create a simple project"""
-        project_path = os.path.join(self.projects_dir, name)
-        os.makedirs(project_path, exist_ok=True)
-        
-        # Create basic files based on type
-        if project_type == "python":
-            with open(os.path.join(project_path, "main.py"), "w") as f:
-                f.write(f'''#!/usr/bin/env python3
+# Resolved once rather than on every Streamlit rerun of main()
+WORKSPACE_ROOT = os.path.expanduser("~/gringo_workspace")
+
+# Starter file templates for SimpleProjectManager, filled with str.format_map
+PYTHON_MAIN_TEMPLATE = '''#!/usr/bin/env python3
 """
 {description}
 """
@@ -38,10 +28,9 @@ def main():
 
 if __name__ == "__main__":
     main()
-''')
-            
-            with open(os.path.join(project_path, "README.md"), "w") as f:
-                f.write(f'''# {name}
+'''
+
+README_TEMPLATE = '''# {name}
 
 {description}
 
@@ -49,11 +38,9 @@ if __name__ == "__main__":
 ```bash
 python main.py
 ```
-''')
-        
-        elif project_type == "web":
-            with open(os.path.join(project_path, "index.html"), "w") as f:
-                f.write(f'''<!DOCTYPE html>
+'''
+
+HTML_TEMPLATE = '''<!DOCTYPE html>
 <html>
 <head>
     <title>{name}</title>
@@ -63,27 +50,79 @@ python main.py
     <p>{description}</p>
 </body>
 </html>
-''')
+'''
+
+# Simple classes to avoid import issues
+class SimpleProjectManager:
+    def __init__(self, workspace_root: str):
+        self.workspace_root = workspace_root
+        self.projects_dir = os.path.join(workspace_root, "projects")
+        os.makedirs(self.projects_dir, exist_ok=True)
+        self._projects_cache = None
+    
+    def create_simple_project(self, name: str, project_type: str, description: str):
+        """Create a simple project"""
+        project_path = os.path.join(self.projects_dir, name)
+        os.makedirs(project_path, exist_ok=True)
+        
+        # Create basic files based on type
+        template_values = {"name": name, "description": description}
+        project_dir = Path(project_path)
+        if project_type == "python":
+            (project_dir / "main.py").write_text(PYTHON_MAIN_TEMPLATE.format_map(template_values))
+            (project_dir / "README.md").write_text(README_TEMPLATE.format_map(template_values))
+        
+        elif project_type == "web":
+            (project_dir / "index.html").write_text(HTML_TEMPLATE.format_map(template_values))
         
         return {"name": name, "path": project_path, "type": project_type}
     
     def list_projects(self):
         """List all projects"""
+        if not os.path.exists(self.projects_dir):
+            return []
+        
+        # Reuse the last listing until a project is added or removed
+        mtime_ns = os.stat(self.projects_dir).st_mtime_ns
+        if self._projects_cache and self._projects_cache[0] == mtime_ns:
+            return self._projects_cache[1]
+        
         projects = []
-        if os.path.exists(self.projects_dir):
-            for item in os.listdir(self.projects_dir):
-                item_path = os.path.join(self.projects_dir, item)
-                if os.path.isdir(item_path):
+        with os.scandir(self.projects_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
                     projects.append({
-                        "name": item,
-                        "path": item_path,
-                        "created": datetime.fromtimestamp(os.path.getctime(item_path)).strftime("%Y-%m-%d")
+                        "name": entry.name,
+                        "path": entry.path,
+                        "created": datetime.fromtimestamp(entry.stat().st_ctime).strftime("%Y-%m-%d")
                     })
+        
+        self._projects_cache = (mtime_ns, projects)
         return projects
 
+async def _run_command(args: list, timeout: float):
+    """Run a command without a shell and return (returncode, stdout, stderr)"""
+    proc = await asyncio.create_subprocess_exec(
+        *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(args, timeout)
+    return proc.returncode, stdout.decode(errors='replace'), stderr.decode(errors='replace')
+
 class SimpleTerminal:
     def __init__(self):
-        self.history = []
+        self.history = deque(maxlen=100)  # Bounded so long sessions don't grow forever
+        self._loop = None
+    
+    def _event_loop(self):
+        """Reuse one event loop across commands instead of creating one per call"""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop
     
     def render(self):
         """Render terminal interface"""
@@ -97,17 +136,17 @@ class SimpleTerminal:
         # Show recent commands
         if self.history:
             st.markdown("**Recent Commands:**")
-            for cmd, output in self.history[-3:]:
+            for cmd, output in islice(self.history, max(0, len(self.history) - 3), None):
                 with st.expander(f"$ {cmd}"):
                     st.code(output)
     
     def execute_command(self, command):
         """Execute command"""
         try:
-            result = subprocess.run(
-                command, shell=True, capture_output=True, text=True, timeout=10
+            returncode, stdout, stderr = self._event_loop().run_until_complete(
+                _run_command(shlex.split(command), timeout=10)
             )
-            output = f"Exit: {result.returncode}\n{result.stdout}\n{result.stderr}"
+            output = f"Exit: {returncode}\n{stdout}\n{stderr}"
             self.history.append((command, output))
             st.success("Command executed")
             st.code(output)
@@ -116,6 +155,12 @@ class SimpleTerminal:
             self.history.append((command, error))
             st.error(error)
 
+@st.cache_data(ttl=5)
+def _list_directory(path: str, mtime_ns: int) -> list:
+    """List the first 10 (name, is_dir) entries of a directory; mtime_ns keys the cache"""
+    with os.scandir(path) as entries:
+        return [(entry.name, entry.is_dir()) for entry in sorted(entries, key=lambda e: e.name)[:10]]
+
 class SimpleFileManager:
     def __init__(self, workspace_root: str):
         self.workspace_root = workspace_root
@@ -141,9 +186,11 @@ class SimpleFileManager:
             # Show content preview
             if uploaded_file.name.endswith(('.py', '.txt', '.md', '.json')):
                 with st.expander("File Preview"):
-                    with open(file_path, 'r') as f:
-                        content = f.read()
-                        st.code(content[:1000] + "..." if len(content) > 1000 else content)
+                    # Read just past the preview limit so large uploads aren't loaded whole
+                    with open(file_path, 'rb') as f:
+                        head = f.read(1001)
+                    content = head[:1000].decode('utf-8', errors='replace')
+                    st.code(content + ("..." if len(head) > 1000 else ""))
         
         # Browse files
         if os.path.exists(self.workspace_root):
@@ -155,18 +202,15 @@ class SimpleFileManager:
         if level > 2:  # Limit depth
             return
         
+        indent = "  " * level
         try:
-            items = sorted(os.listdir(path))
-            for item in items[:10]:  # Limit items
-                item_path = os.path.join(path, item)
-                indent = "  " * level
-                
-                if os.path.isdir(item_path):
-                    st.text(f"{indent}📁 {item}/")
+            for name, is_dir in _list_directory(path, os.stat(path).st_mtime_ns):
+                if is_dir:
+                    st.text(f"{indent}📁 {name}/")
                     if level < 1:  # Only show one level deep
-                        self.show_directory(item_path, level + 1)
+                        self.show_directory(os.path.join(path, name), level + 1)
                 else:
-                    st.text(f"{indent}📄 {item}")
+                    st.text(f"{indent}📄 {name}")
         except PermissionError:
             st.text(f"{indent}❌ Permission denied")
 
@@ -182,7 +226,7 @@ def main():
     st.markdown("**Simple, Working Version - 100% Local AI Assistant**")
     
     # Initialize workspace
-    workspace_root = os.path.expanduser("~/gringo_workspace")
+    workspace_root = WORKSPACE_ROOT
     os.makedirs(workspace_root, exist_ok=True)
     
     # Initialize components
@@ -272,22 +316,30 @@ def main():
         if st.button("Send") and user_input:
             with st.spinner("🤖 Thinking..."):
                 try:
+                    # Only the chat tab talks to Ollama, so import lazily
+                    import json
                     import requests
-                    response = requests.post(
+                    
+                    # Keep one pooled connection to Ollama for the whole session
+                    if 'http_session' not in st.session_state:
+                        st.session_state.http_session = requests.Session()
+                    
+                    response = st.session_state.http_session.post(
                         "http://localhost:11434/api/generate",
                         json={"model": "llama3", "prompt": user_input},
                         stream=True,
                         timeout=30
                     )
                     
-                    full_response = ""
-                    for line in response.iter_lines():
-                        if line:
-                            data = json.loads(line)
-                            full_response += data.get("response", "")
+                    def stream_tokens():
+                        for line in response.iter_lines(decode_unicode=True):
+                            if line:
+                                yield json.loads(line).get("response", "")
                     
+                    # Render tokens as they arrive rather than after the full generation
                     st.markdown(f"**🧠 You:** {user_input}")
-                    st.markdown(f"**🤖 AI:** {full_response}")
+                    st.markdown("**🤖 AI:**")
+                    st.write_stream(stream_tokens())
                     
                 except Exception as e:
                     st.error(f"❌ AI chat failed: {e}")
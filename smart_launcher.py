@@ -6,35 +6,108 @@ Detects available components and launches the best version
 
 import os
 import sys
-import importlib
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+# Import name -> pip package for everything the launcher installs
+REQUIRED_MODULES = {
+    'streamlit': 'streamlit',
+    'requests': 'requests', 
+    'psutil': 'psutil',
+    'schedule': 'schedule'
+}
+
+# --version choice -> launcher file
+VERSION_FILES = {
+    'simple': 'simple_gringo.py',
+    'chat': 'ollama_chat_ui.py',
+    'full': 'gringo_unified_cockpit.py',
+}
+
+# Extra modules the full cockpit needs
+COMPLEX_MODULES = ['schedule', 'psutil']
+
+# (name, file, description, required modules) for each launchable version, least to most featured
+LAUNCH_CANDIDATES = [
+    ("Simple GRINGO", "simple_gringo.py", "Basic functionality, minimal dependencies",
+     frozenset({'streamlit'})),
+    ("Enhanced Chat UI", "ollama_chat_ui.py", "Enhanced chat with project integration",
+     frozenset({'streamlit', 'requests'})),
+    ("Full GRINGO Cockpit", "gringo_unified_cockpit.py", "Complete feature set",
+     frozenset(REQUIRED_MODULES)),
+]
+
+@lru_cache(maxsize=None)
 def check_module(module_name):
-    """Check if a module is available"""
+    """Check if a module is available, without importing it"""
+    from importlib.util import find_spec
+    
     try:
-        importlib.import_module(module_name)
-        return True
-    except ImportError:
+        return find_spec(module_name) is not None
+    except (ValueError, ModuleNotFoundError):
         return False
 
-def install_missing_modules():
-    """Install missing required modules"""
-    required_modules = {
-        'streamlit': 'streamlit',
-        'requests': 'requests', 
-        'psutil': 'psutil',
-        'schedule': 'schedule'
-    }
+def probe_modules(module_names):
+    """Check several modules concurrently; results also land in check_module's cache"""
+    module_names = list(module_names)
+    with ThreadPoolExecutor(max_workers=max(1, len(module_names))) as executor:
+        return dict(zip(module_names, executor.map(check_module, module_names)))
+
+def normalize_distribution(name):
+    """Normalize a distribution name for comparison"""
+    return name.lower().replace('_', '-')
+
+@lru_cache(maxsize=1)
+def installed_distributions():
+    """Names of all installed distributions, from a single metadata scan"""
+    from importlib.metadata import distributions
     
-    missing = []
-    for module, package in required_modules.items():
-        if not check_module(module):
-            missing.append(package)
+    return frozenset(
+        normalize_distribution(dist.metadata['Name'])
+        for dist in distributions()
+        if dist.metadata['Name']
+    )
+
+@lru_cache(maxsize=1)
+def streamlit_command():
+    """Resolve how to start Streamlit for this interpreter"""
+    import shutil
+    
+    # Prefer the console script installed next to this Python, skipping the -m module lookup
+    streamlit_path = shutil.which("streamlit", path=os.path.dirname(sys.executable))
+    if streamlit_path:
+        return [streamlit_path]
+    return [sys.executable, "-m", "streamlit"]
+
+def install_missing_modules(required=frozenset(REQUIRED_MODULES)):
+    """Install the missing modules out of the required import names"""
+    # A frozen build bundles its dependencies and has no pip to run
+    if getattr(sys, 'frozen', False):
+        return True
+    
+    modules = [module for module in REQUIRED_MODULES if module in required]
+    installed = installed_distributions()
+    # Fall back to an import probe for packages without metadata, e.g. some editable installs
+    unlisted = [module for module in modules
+                if normalize_distribution(REQUIRED_MODULES[module]) not in installed]
+    available = probe_modules(unlisted)
+    missing = [REQUIRED_MODULES[module] for module in unlisted if not available[module]]
     
     if missing:
+        # Only pay for subprocess/importlib when something actually needs installing
+        import importlib
+        import subprocess
+        
         print(f"📦 Installing missing packages: {', '.join(missing)}")
         try:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install'] + missing)
+            subprocess.check_call([
+                sys.executable, '-m', 'pip', 'install',
+                '--disable-pip-version-check', '--no-input', '--quiet', '--prefer-binary'
+            ] + missing)
+            # Newly installed packages must be visible to later checks
+            importlib.invalidate_caches()
+            check_module.cache_clear()
+            installed_distributions.cache_clear()
             print("✅ Installation complete!")
             return True
         except subprocess.CalledProcessError as e:
@@ -43,93 +116,128 @@ def install_missing_modules():
     
     return True
 
-def launch_gringo():
-    """Launch the best available version of GRINGO"""
-    
-    print("🤖 GRINGO Personal OS Smart Launcher")
-    print("=" * 40)
+def write_block(lines):
+    """Write several output lines to stdout in a single call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+def launch_gringo(version=None):
+    """Launch the requested or best available version of GRINGO"""
     
     # Check current directory
     current_dir = os.getcwd()
-    print(f"📁 Working directory: {current_dir}")
-    
-    # Check for required files
-    available_versions = []
+    write_block([
+        "🤖 GRINGO Personal OS Smart Launcher",
+        "=" * 40,
+        f"📁 Working directory: {current_dir}",
+    ])
     
-    if os.path.exists("simple_gringo.py"):
-        available_versions.append(("Simple GRINGO", "simple_gringo.py", "Basic functionality, minimal dependencies"))
+    # Probe the cockpit's modules in one concurrent pass
+    complex_status = probe_modules(COMPLEX_MODULES)
+    missing_complex = [mod for mod, ok in complex_status.items() if not ok]
     
-    if os.path.exists("ollama_chat_ui.py"):
-        available_versions.append(("Enhanced Chat UI", "ollama_chat_ui.py", "Enhanced chat with project integration"))
+    # Check for required files with one directory read
+    with os.scandir('.') as entries:
+        present = frozenset(entry.name for entry in entries if entry.is_file())
     
-    if os.path.exists("gringo_unified_cockpit.py"):
-        # Check if all dependencies are available for the full version
-        complex_modules = ['schedule', 'psutil']
-        complex_ready = all(check_module(mod) for mod in complex_modules)
+    available_versions = []
+    for candidate in LAUNCH_CANDIDATES:
+        if candidate[1] not in present:
+            continue
         
-        if complex_ready:
-            available_versions.append(("Full GRINGO Cockpit", "gringo_unified_cockpit.py", "Complete feature set"))
-        else:
-            print(f"⚠️  Full cockpit requires: {', '.join(mod for mod in complex_modules if not check_module(mod))}")
+        if candidate[1] == "gringo_unified_cockpit.py":
+            # Check if all dependencies are available for the full version
+            if missing_complex:
+                print(f"⚠️  Full cockpit requires: {', '.join(missing_complex)}")
+                continue
+        
+        available_versions.append(candidate)
     
     if not available_versions:
         print("❌ No GRINGO versions found!")
         return False
     
-    print(f"\n🚀 Available GRINGO versions:")
-    for i, (name, file, desc) in enumerate(available_versions, 1):
-        print(f"  {i}. {name} ({file})")
-        print(f"     {desc}")
+    # The last available version has the most features
+    recommended = available_versions[-1]
+    by_filename = {v[1]: v for v in available_versions}
+    
+    lines = ["\n🚀 Available GRINGO versions:"]
+    for i, (name, file, desc, _) in enumerate(available_versions, 1):
+        lines.append(f"  {i}. {name} ({file})")
+        lines.append(f"     {desc}")
     
-    # Auto-select best version or let user choose
-    if len(available_versions) == 1:
+    # Use the requested version, auto-select the best one, or let the user choose
+    if version:
+        selected_version = by_filename.get(VERSION_FILES[version])
+        if selected_version is None:
+            lines.append(f"\n⚠️  Requested version '{version}' is not available")
+            selected_version = recommended
+        lines.append(f"\n🎯 Launching: {selected_version[0]}")
+        write_block(lines)
+    elif len(available_versions) == 1:
         selected_version = available_versions[0]
-        print(f"\n🎯 Auto-launching: {selected_version[0]}")
+        lines.append(f"\n🎯 Auto-launching: {selected_version[0]}")
+        write_block(lines)
+    elif not sys.stdin.isatty():
+        # Nobody to answer a prompt when piped or scripted
+        selected_version = recommended
+        lines.append(f"\n🎯 Auto-launching recommended: {recommended[0]} (no terminal for prompt)")
+        write_block(lines)
     else:
-        print(f"\n🎯 Recommended: {available_versions[-1][0]} (most features)")
+        lines.append(f"\n🎯 Recommended: {recommended[0]} (most features)")
+        write_block(lines)
         
         try:
             choice = input(f"\nSelect version (1-{len(available_versions)}) or press Enter for recommended: ").strip()
             
             if choice == "":
-                selected_version = available_versions[-1]  # Most advanced
+                selected_version = recommended
             else:
                 idx = int(choice) - 1
                 if 0 <= idx < len(available_versions):
                     selected_version = available_versions[idx]
                 else:
-                    selected_version = available_versions[-1]
+                    selected_version = recommended
         except (ValueError, KeyboardInterrupt):
-            selected_version = available_versions[-1]
+            selected_version = recommended
     
-    # Install missing modules if needed
-    if not install_missing_modules():
+    # Install missing modules if needed, checking only what the selected version uses
+    if not install_missing_modules(selected_version[3]):
         print("⚠️  Some modules missing, launching simple version...")
-        selected_version = next((v for v in available_versions if v[1] == "simple_gringo.py"), available_versions[0])
+        selected_version = by_filename.get("simple_gringo.py", available_versions[0])
+    
+    # Determine port based on version
+    if "simple" in selected_version[1]:
+        port = "8503"
+    else:
+        port = "8501"
     
     # Launch selected version
-    print(f"\n🚀 Launching {selected_version[0]}...")
-    print(f"📁 File: {selected_version[1]}")
-    print(f"🌐 Will open browser to: http://localhost:8501")
-    print(f"🛑 Press Ctrl+C to stop")
-    print("-" * 40)
+    write_block([
+        f"\n🚀 Launching {selected_version[0]}...",
+        f"📁 File: {selected_version[1]}",
+        f"🌐 Will open browser to: http://localhost:{port}",
+        "🛑 Press Ctrl+C to stop",
+        "-" * 40,
+    ])
     
     try:
-        # Determine port based on version
-        if "simple" in selected_version[1]:
-            port = "8503"
-        else:
-            port = "8501"
-        
-        cmd = [
-            sys.executable, "-m", "streamlit", "run", 
+        cmd = streamlit_command() + [
+            "run", 
             selected_version[1],
             "--server.port", port,
             "--server.address", "localhost",
             "--browser.gatherUsageStats", "false"
         ]
         
+        if os.name == 'posix':
+            # Replace the launcher with Streamlit rather than keeping it resident to wait
+            sys.stdout.flush()
+            os.execv(cmd[0], cmd)
+        
+        import subprocess
         subprocess.run(cmd)
+        return True
         
     except KeyboardInterrupt:
         print("\n🛑 GRINGO Personal OS stopped")
@@ -138,10 +246,21 @@ def launch_gringo():
         print(f"❌ Launch failed: {e}")
         return False
 
+def parse_args(argv=None):
+    """Parse launcher command line options"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Launch the best available GRINGO Personal OS version")
+    parser.add_argument('--version', choices=sorted(VERSION_FILES),
+                        help="Launch this version instead of prompting")
+    return parser.parse_args(argv)
+
 def main():
     """Main launcher function"""
+    args = parse_args()
+    
     try:
-        success = launch_gringo()
+        success = launch_gringo(args.version)
         return 0 if success else 1
     except Exception as e:
         print(f"❌ Launcher error: {e}")
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""Basic arithmetic and string tests for parallel testing demo"""
+
+import operator
+
+import pytest
+
+@pytest.mark.parametrize("a,b,op,expected", [
+    (2, 2, operator.add, 4),
+    (3, 4, operator.mul, 12),
+    (8, 2, operator.truediv, 4.0),
+])
+def test_arithmetic(a, b, op, expected):
+    assert op(a, b) == expected
+
+@pytest.mark.parametrize("text,expected", [
+    ("hello", "HELLO"),
+])
+def test_string_upper(text, expected):
+    assert text.upper() == expected
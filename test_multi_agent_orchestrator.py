@@ -48,6 +48,17 @@ class TestMulti_Agent_Orchestrator(unittest.TestCase):
         # Function signature: run_feature_pipeline(self, feature_request)
         self.skipTest("Test implementation needed")
 
+    def test_get_registered_agents(self):
+        """Test get_registered_agents reports each agent's description and script health"""
+        orchestrator = multi_agent_orchestrator.MultiAgentOrchestrator()
+        orchestrator.register_agent("present", os.path.abspath(__file__), "Exists")
+        orchestrator.register_agent("missing", "no_such_agent.py", "Missing")
+        
+        self.assertEqual(orchestrator.get_registered_agents(), {
+            "present": {"description": "Exists", "healthy": True},
+            "missing": {"description": "Missing", "healthy": False},
+        })
+
     def test_get_summary(self):
         """Test get_summary function"""
         # TODO: Implement test for get_summary
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Prompt classification and page rendering tests for ultimate_gringo.py"""
+
+import os
+
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("requests")
+
+from ultimate_gringo import FullProjectManager
+
+@pytest.mark.parametrize("prompt,expected", [
+    ("Build a few simple games", 'game'),
+    ("Make two websites for my shop", 'web'),
+    ("Write servers and apis for inventory", 'backend'),
+    ("Charts and visualizations of sales data", 'data_science'),
+    ("Scripts that organize my files", 'automation'),
+    ("A set of handy tools", 'automation'),
+    ("Run an analysis of the numbers", 'data_science'),
+])
+def test_analyze_prompt_project_type(prompt, expected):
+    manager = FullProjectManager.__new__(FullProjectManager)
+    assert manager._analyze_prompt(prompt)['type'] == expected
+
+def test_render_agent_status_lists_registered_agents(monkeypatch):
+    import types
+    import ultimate_gringo
+    from multi_agent_orchestrator import MultiAgentOrchestrator
+    
+    orchestrator = MultiAgentOrchestrator()
+    planner_script = os.path.join(os.path.dirname(ultimate_gringo.__file__), "agents", "planner_agent.py")
+    orchestrator.register_agent("planner", planner_script, "Task planning and breakdown")
+    orchestrator.register_agent("ghost", "no_such_agent.py", "Missing script")
+    monkeypatch.setattr(ultimate_gringo.st, "session_state", types.SimpleNamespace(orchestrator=orchestrator))
+    written = []
+    monkeypatch.setattr(ultimate_gringo.st, "write", written.append)
+    
+    # Called undecorated: outside a script run the fragment wrapper would swallow errors
+    ultimate_gringo._render_agent_status.__wrapped__()
+    
+    assert "**Description:** Task planning and breakdown" in written
+    assert "**Status:** ✅ Ready" in written
+    assert "**Status:** ❌ Error" in written
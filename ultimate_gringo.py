@@ -7,17 +7,33 @@ Complete development dashboard with agent orchestration
 import streamlit as st
 import os
 import sys
+import io
 import json
+import re
 import tempfile
 import zipfile
 import shutil
 from datetime import datetime
 import subprocess
 import sqlite3
+import threading
+import time
+import queue
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
 from custom_tools_manager import CustomToolsManager
 from multi_agent_orchestrator import MultiAgentOrchestrator, AgentResult
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Set page config first
 st.set_page_config(
     page_title="🤖 GRINGO AI OS - Ultimate Development Environment",
@@ -27,7 +43,7 @@ st.set_page_config(
 )
 
 # Custom CSS for GRINGO branding
-st.markdown("""
+GRINGO_CSS = """
 <style>
     .gringo-header {
         background: linear-gradient(135deg, #1e3a8a 0%, #0f172a 100%);
@@ -81,7 +97,312 @@ st.markdown("""
         transform: translateY(-2px);
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Minified once at import; Streamlit drops elements a rerun doesn't redraw, so it is still sent every run
+GRINGO_CSS_MIN = re.sub(r'\s*([{}:;,])\s*', r'\1', re.sub(r'\s+', ' ', GRINGO_CSS)).strip()
+st.markdown(GRINGO_CSS_MIN, unsafe_allow_html=True)
+
+# Connection tuning applied once when the project manager opens its database
+PROJECTS_DB_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA cache_size=-20000;
+    PRAGMA mmap_size=268435456;
+    PRAGMA temp_store=MEMORY;
+"""
+
+# apply_learning keeps this many parsed metadata entries, keyed by project name
+LEARNING_CACHE_SIZE = 64
+
+# Extension -> pattern reported by _analyze_uploaded_files, in report order
+PATTERN_MAP = {
+    '.py': 'Python project',
+    '.js': 'JavaScript project',
+    '.html': 'Web project',
+    '.rs': 'Rust project'
+}
+
+# Extension -> language considered by _detect_primary_language
+LANGUAGE_BY_EXTENSION = {
+    '.py': 'Python',
+    '.js': 'JavaScript', 
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.c': 'C'
+}
+
+# Starter file templates for _create_python_project, filled with str.format_map
+PYTHON_MAIN_TEMPLATE = '''#!/usr/bin/env python3
+"""
+{prompt}
+"""
+
+def main():
+    """Main application function"""
+    print("🚀 Project: {name}")
+    print("📝 Description: {summary}...")
+    
+    # TODO: Implement your project logic here
+    print("\\n✅ Project template ready!")
+
+if __name__ == "__main__":
+    main()
+'''
+
+README_TEMPLATE = '''# {name}
+
+{prompt}
+
+## Usage
+```bash
+python main.py
+```
+
+---
+*Generated by GRINGO Personal OS*
+'''
+
+# Local Ollama endpoint behind every AI call in the dashboard
+OLLAMA_GENERATE_URL = "http://localhost:11434/api/generate"
+
+# Background Ollama requests: worker threads, and how often a waiting fragment checks on its request
+OLLAMA_WORKERS = 4
+OLLAMA_POLL_SECONDS = 0.5
+
+# Connection attempts retried (with backoff) while Ollama is still starting; never re-sent once the server has the request
+OLLAMA_CONNECT_RETRIES = 2
+
+# How long Ollama keeps the model loaded after each request
+OLLAMA_KEEP_ALIVE = "30m"
+
+# Completed tool-creator answers each session keeps for replaying an identical prompt
+OLLAMA_CACHE_SIZE = 32
+
+# Output token cap for the tool suggestions answer (five short entries), which bounds its latency
+SUGGESTIONS_NUM_PREDICT = 512
+
+# Bumped whenever _init_database's schema statements change
+PROJECTS_SCHEMA_VERSION = 1
+
+# Row inserts for learned and linked projects: (name, path, type, status, created_at, metadata)
+INSERT_PROJECT_SQL = '''
+    INSERT INTO projects (name, path, type, status, created_at, metadata)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+# Upsert for projects generated from a prompt: (name, type, description, path, metadata)
+SAVE_PROJECT_SQL = '''
+    INSERT OR REPLACE INTO projects (name, type, description, path, metadata)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+# Prompt keywords for each project type, checked in order
+PROJECT_TYPE_KEYWORDS = (
+    ('web', frozenset({'web', 'website', 'frontend', 'html', 'css', 'react', 'vue'})),
+    ('backend', frozenset({'api', 'backend', 'server', 'flask', 'django', 'fastapi'})),
+    ('data_science', frozenset({'data', 'analysis', 'pandas', 'csv', 'charts', 'visualization'})),
+    ('game', frozenset({'game', 'pygame', '2d', 'platformer', 'arcade'})),
+    ('automation', frozenset({'automation', 'script', 'tool', 'file', 'organize'})),
+    ('utility', frozenset({'calculator', 'math', 'compute', 'calculate'})),
+)
+
+# Prompt keywords for each language, checked in order
+LANGUAGE_KEYWORDS = (
+    ('python', frozenset({'python', 'py', 'pygame', 'flask', 'django', 'pandas'})),
+    ('javascript', frozenset({'javascript', 'js', 'node', 'react', 'html'})),
+)
+
+PROMPT_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Agent sequence for each predefined workflow, in the order the pipelines tab lists them
+PIPELINE_AGENTS = {
+    "Full Development Cycle": ("planner", "refactor", "test_gen", "security", "doc_gen", "deploy"),
+    "Code Quality Audit": ("reviewer", "refactor", "test_gen", "performance"),
+    "Security Hardening": ("security", "reviewer", "test_gen", "doc_gen"), 
+    "Performance Optimization": ("performance", "refactor", "test_gen", "analytics"),
+    "Documentation Suite": ("analytics", "doc_gen", "reviewer")
+}
+PIPELINE_PREVIEW = {name: " → ".join(agents) for name, agents in PIPELINE_AGENTS.items()}
+
+# Agent outputs longer than this are offered as a download with a short preview
+MAX_RENDERED_OUTPUT = 50_000
+OUTPUT_PREVIEW_CHARS = 2_000
+
+# analyze_workspace counter for each counted file extension
+WORKSPACE_FILE_BUCKETS = {'.py': 'python_files', '.js': 'js_files'}
+
+# analyze_workspace never enters these (or hidden) directories and stops counting after WORKSPACE_MAX_FILES files
+WORKSPACE_SKIP_DIRS = frozenset({'node_modules', '__pycache__', 'venv', 'dist', 'build'})
+WORKSPACE_MAX_FILES = 50_000
+
+# Text fallback for AI tool responses: first "name:"/"tool:" line, and the first fenced code block
+AI_TOOL_NAME_RE = re.compile(r'^.*(?:name|tool):.*$', re.IGNORECASE | re.MULTILINE)
+AI_CODE_BLOCK_RE = re.compile(r'```[^\n]*\n(.*?)^[^\n]*```[^\n]*$', re.DOTALL | re.MULTILINE)
+
+# run_project keeps only the last 64 KB of each output stream and redraws at most every 100 ms
+RUN_OUTPUT_TAIL_BYTES = 64 * 1024
+RUN_OUTPUT_REFRESH_SECONDS = 0.1
+
+# Tool code longer than this runs from a temp file instead of a -c argument (Linux caps one argument at 128 KiB)
+TOOL_INLINE_MAX_CHARS = 32 * 1024
+
+class _OutputTail:
+    """Bounded tail of a text stream, filled by a reader thread"""
+    def __init__(self, limit: int = RUN_OUTPUT_TAIL_BYTES):
+        self.limit = limit
+        self.lines = deque()
+        self.size = 0
+        self.lock = threading.Lock()
+    
+    def feed(self, pipe):
+        """Read lines from pipe until EOF, dropping the oldest beyond the limit"""
+        with pipe:
+            for line in pipe:
+                with self.lock:
+                    self.lines.append(line)
+                    self.size += len(line)
+                    while self.size > self.limit and len(self.lines) > 1:
+                        self.size -= len(self.lines.popleft())
+                    if self.size > self.limit:
+                        self.lines[0] = self.lines[0][self.size - self.limit:]
+                        self.size = self.limit
+    
+    def text(self) -> str:
+        with self.lock:
+            return ''.join(self.lines)
+
+def _collect_output(process, timeout, on_output=None):
+    """Wait for process, passing its output so far to on_output; returns (stdout, stderr) tails"""
+    # Drain both pipes in the background so neither can fill up and block the child
+    stdout_tail, stderr_tail = _OutputTail(), _OutputTail()
+    readers = [
+        threading.Thread(target=stdout_tail.feed, args=(process.stdout,), daemon=True),
+        threading.Thread(target=stderr_tail.feed, args=(process.stderr,), daemon=True)
+    ]
+    for reader in readers:
+        reader.start()
+    
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            process.wait(timeout=RUN_OUTPUT_REFRESH_SECONDS)
+            break
+        except subprocess.TimeoutExpired:
+            if time.monotonic() >= deadline:
+                process.kill()
+                process.wait()
+                raise subprocess.TimeoutExpired(process.args, timeout)
+            if on_output:
+                on_output(stdout_tail.text())
+    
+    for reader in readers:
+        reader.join()
+    
+    return stdout_tail.text(), stderr_tail.text()
+
+# How long the Link tab trusts its last folder existence check
+EXISTS_CACHE_SECONDS = 0.5
+
+# Uploads are written in slices of this size so a large file never needs one huge write
+UPLOAD_WRITE_CHUNK = 4 * 1024 * 1024
+
+def _write_upload(file_path, data):
+    """Write an uploaded file's buffer straight to disk"""
+    view = memoryview(data)
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        while view.nbytes:
+            written = os.write(fd, view[:UPLOAD_WRITE_CHUNK])
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+# ioctl request for a copy-on-write file clone on Linux filesystems that support it (btrfs, XFS)
+FICLONE = 0x40049409
+
+# How long a save button waits for its queued write before reporting it as still in progress
+SAVE_WAIT_SECONDS = 5
+
+def _clone_or_copy(src, dst):
+    """Copy a file as a copy-on-write clone where the filesystem allows it, else with shutil.copy2"""
+    try:
+        import fcntl
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    except (ImportError, OSError):
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+class _BackgroundWriter:
+    """Daemon thread that writes queued files in order, off the Streamlit script thread"""
+    
+    def __init__(self):
+        self._queue = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+    
+    def put(self, path, data, mode=None):
+        """Queue bytes to atomically replace the file at path; the returned Future resolves to path or raises the OSError"""
+        future = Future()
+        self._queue.put((path, data, mode, future))
+        return future
+    
+    def _run(self):
+        """Write queued files until the process exits"""
+        while True:
+            path, data, mode, future = self._queue.get()
+            # Written beside the target and renamed over it, so a crash never leaves a truncated file
+            tmp_path = path + ".tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                if mode is not None:
+                    os.chmod(tmp_path, mode)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                future.set_exception(e)
+            else:
+                future.set_result(path)
+
+def _dumps_bytes(obj):
+    """Serialize to compact JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def _export_tools_json(manager, tools):
+    """Build the tools backup one tool at a time: a JSON array with one exported tool per line"""
+    buf = io.BytesIO()
+    buf.write(b'[')
+    for i, export_data in enumerate(manager.export_all([tool['id'] for tool in tools])):
+        buf.write(b',\n' if i else b'\n')
+        buf.write(_dumps_bytes(export_data))
+    buf.write(b'\n]' if tools else b']')
+    return buf.getvalue()
+
+def _walk_files(path):
+    """Yield a DirEntry for every file under path, like os.walk without following directory symlinks"""
+    stack = [path]
+    while stack:
+        # Like os.walk, directories that can't be listed are skipped
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                else:
+                    yield entry
 
 class FullProjectManager:
     def __init__(self, workspace_root: str):
@@ -90,6 +411,8 @@ class FullProjectManager:
         self.uploads_dir = os.path.join(workspace_root, "uploads")
         self.templates_dir = os.path.join(workspace_root, "templates")
         self.db_path = os.path.join(workspace_root, "projects.db")
+        self._db_lock = threading.Lock()
+        self._learning_cache = {}
         self._init_directories()
         self._init_database()
     
@@ -99,11 +422,18 @@ class FullProjectManager:
             os.makedirs(dir_path, exist_ok=True)
     
     def _init_database(self):
-        """Initialize projects database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        """Open the shared projects database connection and create the schema"""
+        # One autocommit connection for the manager's lifetime, shared across Streamlit threads
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.executescript(PROJECTS_DB_PRAGMAS)
+        
+        # Schema statements only run when the file predates PROJECTS_SCHEMA_VERSION
+        if self._conn.execute('PRAGMA user_version').fetchone()[0] >= PROJECTS_SCHEMA_VERSION:
+            return
+        
+        # name is UNIQUE, so SQLite already indexes it; list_projects sorts on created_at
+        self._conn.executescript(f'''
+            BEGIN IMMEDIATE;
             CREATE TABLE IF NOT EXISTS projects (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT UNIQUE,
@@ -113,11 +443,11 @@ class FullProjectManager:
                 status TEXT DEFAULT 'active',
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 metadata TEXT
-            )
+            );
+            CREATE INDEX IF NOT EXISTS idx_projects_created_at ON projects(created_at DESC);
+            PRAGMA user_version = {PROJECTS_SCHEMA_VERSION};
+            COMMIT;
         ''')
-        
-        conn.commit()
-        conn.close()
     
     def create_project_from_prompt(self, prompt: str, project_name: str = None) -> dict:
         """Create a project from natural language prompt"""
@@ -137,6 +467,7 @@ class FullProjectManager:
         
         # Save to database
         self._save_project_to_db(project_name, project_info, project_path, prompt)
+        _cached_list_projects.clear()
         
         return {
             "name": project_name,
@@ -151,30 +482,19 @@ class FullProjectManager:
     def _analyze_prompt(self, prompt: str) -> dict:
         """Analyze prompt to determine project type and language"""
         prompt_lower = prompt.lower()
+        tokens = set(PROMPT_TOKEN_RE.findall(prompt_lower))
+        # Also match plurals ("games", "apis") against the singular keywords
+        tokens |= {token[:-1] for token in tokens if len(token) > 2 and token.endswith('s')}
         
         # Detect project type
-        if any(word in prompt_lower for word in ['web', 'website', 'frontend', 'html', 'css', 'react', 'vue']):
-            project_type = 'web'
-        elif any(word in prompt_lower for word in ['api', 'backend', 'server', 'flask', 'django', 'fastapi']):
-            project_type = 'backend'
-        elif any(word in prompt_lower for word in ['data', 'analysis', 'pandas', 'csv', 'charts', 'visualization']):
-            project_type = 'data_science'
-        elif any(word in prompt_lower for word in ['game', 'pygame', '2d', 'platformer', 'arcade']):
-            project_type = 'game'
-        elif any(word in prompt_lower for word in ['automation', 'script', 'tool', 'file', 'organize']):
-            project_type = 'automation'
-        elif any(word in prompt_lower for word in ['calculator', 'math', 'compute', 'calculate']):
-            project_type = 'utility'
-        else:
-            project_type = 'general'
+        project_type = next(
+            (ptype for ptype, keywords in PROJECT_TYPE_KEYWORDS if tokens & keywords), 'general'
+        )
         
         # Detect language
-        if any(word in prompt_lower for word in ['python', 'py', 'pygame', 'flask', 'django', 'pandas']):
-            language = 'python'
-        elif any(word in prompt_lower for word in ['javascript', 'js', 'node', 'react', 'html']):
-            language = 'javascript'
-        else:
-            language = 'python'  # Default
+        language = next(
+            (lang for lang, keywords in LANGUAGE_KEYWORDS if tokens & keywords), 'python'  # Default
+        )
         
         return {
             'type': project_type,
@@ -217,16 +537,16 @@ class FullProjectManager:
         file_info = []
         for uploaded_file in uploaded_files:
             file_path = os.path.join(project_path, uploaded_file.name)
-            with open(file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
+            data = uploaded_file.getbuffer()
+            _write_upload(file_path, data)
             file_info.append({
                 'name': uploaded_file.name,
-                'size': len(uploaded_file.getbuffer()),
+                'size': data.nbytes,
                 'type': uploaded_file.type
             })
         
         # Analyze files with AI (if available)
-        analysis = self._analyze_uploaded_files(project_path, learn_prompt)
+        analysis = self._analyze_uploaded_files(project_path, learn_prompt, collect_structure=True)
         
         # Store learning data
         learning_data = {
@@ -238,15 +558,10 @@ class FullProjectManager:
         }
         
         # Save to database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO projects (name, path, type, status, created_at, metadata)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (project_name, project_path, 'learning', 'analyzed', 
-              datetime.now().isoformat(), json.dumps(learning_data)))
-        conn.commit()
-        conn.close()
+        self.save_projects_bulk([
+            (project_name, project_path, 'learning', 'analyzed', 
+             datetime.now().isoformat(), json.dumps(learning_data))
+        ])
         
         return {
             'name': project_name,
@@ -255,31 +570,26 @@ class FullProjectManager:
             'files_count': len(file_info)
         }
     
-    def _analyze_uploaded_files(self, project_path: str, prompt: str) -> dict:
+    def _analyze_uploaded_files(self, project_path: str, prompt: str, collect_structure: bool = False) -> dict:
         """Analyze uploaded files to understand patterns and structure"""
         analysis = {
-            'file_types': {},
+            'file_types': Counter(),
             'structure': [],
             'patterns': [],
             'suggestions': []
         }
         
         try:
-            # Analyze file structure
-            for root, dirs, files in os.walk(project_path):
-                rel_root = os.path.relpath(root, project_path)
-                for file in files:
-                    ext = os.path.splitext(file)[1]
-                    analysis['file_types'][ext] = analysis['file_types'].get(ext, 0) + 1
-                    analysis['structure'].append(os.path.join(rel_root, file))
+            # Analyze file structure; the relative paths are only kept when asked for
+            file_types = analysis['file_types']
+            structure = analysis['structure']
+            for entry in _walk_files(project_path):
+                file_types[os.path.splitext(entry.name)[1]] += 1
+                if collect_structure:
+                    structure.append(os.path.relpath(entry.path, project_path))
             
             # Basic pattern detection
-            if '.py' in analysis['file_types']:
-                analysis['patterns'].append('Python project')
-            if '.js' in analysis['file_types']:
-                analysis['patterns'].append('JavaScript project')
-            if '.html' in analysis['file_types']:
-                analysis['patterns'].append('Web project')
+            analysis['patterns'] = [pattern for ext, pattern in PATTERN_MAP.items() if ext in file_types]
             
             # Generate suggestions based on analysis
             analysis['suggestions'] = [
@@ -295,23 +605,13 @@ class FullProjectManager:
     
     def _detect_primary_language(self, file_types: dict) -> str:
         """Detect primary programming language"""
-        lang_map = {
-            '.py': 'Python',
-            '.js': 'JavaScript', 
-            '.html': 'HTML',
-            '.css': 'CSS',
-            '.java': 'Java',
-            '.cpp': 'C++',
-            '.c': 'C'
-        }
-        
         max_count = 0
         primary_lang = 'Unknown'
         
         for ext, count in file_types.items():
-            if ext in lang_map and count > max_count:
+            if ext in LANGUAGE_BY_EXTENSION and count > max_count:
                 max_count = count
-                primary_lang = lang_map[ext]
+                primary_lang = LANGUAGE_BY_EXTENSION[ext]
         
         return primary_lang
     
@@ -320,16 +620,7 @@ class FullProjectManager:
         enhanced_name = f"enhanced_{learning_project}_{datetime.now().strftime('%H%M')}"
         
         # Get learning data
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT metadata FROM projects WHERE name = ?', (learning_project,))
-        result = cursor.fetchone()
-        conn.close()
-        
-        if not result:
-            raise ValueError(f"Learning project {learning_project} not found")
-        
-        learning_data = json.loads(result[0])
+        learning_data = self._load_learning_metadata(learning_project)
         
         # Create enhanced project using learning insights
         combined_prompt = f"""
@@ -345,6 +636,26 @@ class FullProjectManager:
         
         return self.create_project_from_prompt(combined_prompt, enhanced_name)
     
+    def _load_learning_metadata(self, learning_project: str) -> dict:
+        """Parsed metadata of a project, cached until _save_project_to_db replaces its row"""
+        with self._db_lock:
+            learning_data = self._learning_cache.get(learning_project)
+            if learning_data is not None:
+                return learning_data
+            
+            result = self._conn.execute(
+                'SELECT metadata FROM projects WHERE name = ?', (learning_project,)
+            ).fetchone()
+            
+            if not result:
+                raise ValueError(f"Learning project {learning_project} not found")
+            
+            learning_data = json.loads(result[0])
+            if len(self._learning_cache) >= LEARNING_CACHE_SIZE:
+                self._learning_cache.pop(next(iter(self._learning_cache)))
+            self._learning_cache[learning_project] = learning_data
+            return learning_data
+    
     def link_external_folder(self, folder_path: str, project_name: str, copy_mode: bool = True) -> dict:
         """Link or copy external folder as a project"""
         if not os.path.exists(folder_path):
@@ -356,7 +667,7 @@ class FullProjectManager:
             # Copy folder to workspace
             if os.path.exists(project_path):
                 shutil.rmtree(project_path)
-            shutil.copytree(folder_path, project_path)
+            shutil.copytree(folder_path, project_path, copy_function=_clone_or_copy)
             status = 'copied'
         else:
             # Create symlink (work in place)
@@ -369,19 +680,14 @@ class FullProjectManager:
         analysis = self._analyze_uploaded_files(project_path, f"Analyze linked folder: {folder_path}")
         
         # Store in database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO projects (name, path, type, status, created_at, metadata)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (project_name, project_path, 'linked', status,
-              datetime.now().isoformat(), json.dumps({
-                  'original_path': folder_path,
-                  'copy_mode': copy_mode,
-                  'analysis': analysis
-              })))
-        conn.commit()
-        conn.close()
+        self.save_projects_bulk([
+            (project_name, project_path, 'linked', status,
+             datetime.now().isoformat(), json.dumps({
+                 'original_path': folder_path,
+                 'copy_mode': copy_mode,
+                 'analysis': analysis
+             }))
+        ])
         
         return {
             'name': project_name,
@@ -409,85 +715,76 @@ class FullProjectManager:
     def _create_python_project(self, project_path: str, project_info: dict, prompt: str) -> list:
         """Create Python project files"""
         files = []
+        project_dir = Path(project_path)
         
-        # main.py with basic template based on type
-        main_content = f'''#!/usr/bin/env python3
-"""
-{prompt}
-"""
-
-def main():
-    """Main application function"""
-    print("🚀 Project: {project_info.get('suggested_name', 'New Project')}")
-    print("📝 Description: {prompt[:100]}...")
-    
-    # TODO: Implement your project logic here
-    print("\\n✅ Project template ready!")
-
-if __name__ == "__main__":
-    main()
-'''
+        template_values = {
+            'name': project_info.get('suggested_name', 'New Project'),
+            'prompt': prompt,
+            'summary': prompt[:100]
+        }
         
-        with open(os.path.join(project_path, 'main.py'), 'w') as f:
-            f.write(main_content)
+        # main.py with basic template based on type
+        main_content = PYTHON_MAIN_TEMPLATE.format_map(template_values)
+        (project_dir / 'main.py').write_text(main_content, encoding='utf-8')
         files.append('🐍 main.py')
         
         # requirements.txt
         requirements = ['requests']  # Basic requirements
-        with open(os.path.join(project_path, 'requirements.txt'), 'w') as f:
-            f.write('\n'.join(requirements))
+        (project_dir / 'requirements.txt').write_text('\n'.join(requirements), encoding='utf-8')
         files.append('📦 requirements.txt')
         
         # README.md
-        readme_content = f'''# {project_info.get('suggested_name', 'New Project')}
-
-{prompt}
-
-## Usage
-```bash
-python main.py
-```
-
----
-*Generated by GRINGO Personal OS*
-'''
-        with open(os.path.join(project_path, 'README.md'), 'w') as f:
-            f.write(readme_content)
+        readme_content = README_TEMPLATE.format_map(template_values)
+        (project_dir / 'README.md').write_text(readme_content, encoding='utf-8')
         files.append('📖 README.md')
         
         return files
     
     def _save_project_to_db(self, name: str, project_info: dict, path: str, prompt: str):
         """Save project to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO projects (name, type, description, path, metadata)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
-            name,
-            project_info['type'],
-            prompt,
-            path,
-            json.dumps(project_info)
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._db_lock:
+            self._learning_cache.pop(name, None)
+            self._conn.execute(SAVE_PROJECT_SQL, (
+                name,
+                project_info['type'],
+                prompt,
+                path,
+                json.dumps(project_info)
+            ))
+    
+    def save_projects_bulk(self, rows) -> None:
+        """Insert project rows (name, path, type, status, created_at, metadata) in one transaction"""
+        with self._db_lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.executemany(INSERT_PROJECT_SQL, rows)
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+        _cached_list_projects.clear()
     
     def list_projects(self) -> list:
-        """List all projects"""
-        if not os.path.exists(self.db_path):
-            return []
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """List all projects, reusing the cached listing until the database changes"""
+        return _cached_list_projects(self, self.db_path, self._db_mtime())
+    
+    def _db_mtime(self) -> tuple:
+        """Modification stamps of the database and its WAL file"""
+        stamps = []
+        for path in (self.db_path, self.db_path + '-wal'):
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except FileNotFoundError:
+                stamps.append(0)
+        return tuple(stamps)
+    
+    def _query_projects(self) -> list:
+        """Read all projects from the database"""
+        with self._db_lock:
+            rows = self._conn.execute('SELECT * FROM projects ORDER BY created_at DESC').fetchall()
         
-        cursor.execute('SELECT * FROM projects ORDER BY created_at DESC')
         projects = []
-        
-        for row in cursor.fetchall():
+        for row in rows:
             projects.append({
                 'id': row[0],
                 'name': row[1],
@@ -498,35 +795,40 @@ python main.py
                 'created_at': row[6]
             })
         
-        conn.close()
         return projects
     
-    def run_project(self, project_name: str) -> dict:
-        """Run a project"""
-        projects = self.list_projects()
-        project = next((p for p in projects if p['name'] == project_name), None)
+    def run_project(self, project_name: str, on_output=None, timeout: float = 10) -> dict:
+        """Run a project, passing the output so far to on_output while it runs"""
+        with self._db_lock:
+            row = self._conn.execute(
+                'SELECT path FROM projects WHERE name = ? LIMIT 1', (project_name,)
+            ).fetchone()
         
-        if not project:
+        if row is None:
             return {"error": "Project not found"}
         
-        project_path = project['path']
+        project_path = row[0]
         main_file = os.path.join(project_path, 'main.py')
         
         if os.path.exists(main_file):
             try:
-                result = subprocess.run(
-                    ['python', 'main.py'],
+                # -u so the output reaches on_output while the project runs, not when it exits
+                process = subprocess.Popen(
+                    [sys.executable, '-u', 'main.py'],
                     cwd=project_path,
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
                     text=True,
-                    timeout=10
+                    bufsize=1
                 )
                 
+                stdout, stderr = _collect_output(process, timeout, on_output)
+                
                 return {
                     "success": True,
-                    "output": result.stdout,
-                    "errors": result.stderr,
-                    "return_code": result.returncode
+                    "output": stdout,
+                    "errors": stderr,
+                    "return_code": process.returncode
                 }
                 
             except Exception as e:
@@ -534,6 +836,76 @@ python main.py
         
         return {"error": "No runnable file found"}
 
+@st.cache_data(ttl=30)
+def _cached_list_projects(_manager, db_path, mtime):
+    """Project listing cached per database and modification stamp"""
+    return _manager._query_projects()
+
+def _cached_exists(path):
+    """os.path.exists for the Link tab, reusing the last answer for the same path briefly"""
+    now = time.monotonic()
+    cached = st.session_state.get('_exists_cache')
+    if cached and cached[0] == path and now - cached[1] < EXISTS_CACHE_SECONDS:
+        return cached[2]
+    
+    exists = os.path.exists(path)
+    st.session_state['_exists_cache'] = (path, now, exists)
+    return exists
+
+@st.cache_resource
+def get_project_manager(workspace_root):
+    """Project manager shared by every session and rerun"""
+    return FullProjectManager(workspace_root)
+
+@st.cache_resource
+def get_orchestrator(workspace_root):
+    """Orchestrator with all agents registered, shared by every session and rerun"""
+    orchestrator = MultiAgentOrchestrator(workspace_root)
+    
+    # Register all available agents
+    agent_configs = {
+        "planner": ("agents/planner_agent.py", "Task planning and breakdown"),
+        "refactor": ("agents/refactor_agent.py", "Code refactoring and optimization"),
+        "test_gen": ("agents/test_generator_agent.py", "Automated test generation"),
+        "doc_gen": ("agents/doc_generator_agent.py", "Documentation generation"),
+        "reviewer": ("agents/review_agent.py", "Code review and quality analysis"),
+        "security": ("agents/security_agent.py", "Security analysis and hardening"),
+        "performance": ("agents/performance_agent.py", "Performance optimization"),
+        "api": ("agents/api_agent.py", "API development and testing"),
+        "deploy": ("agents/deploy_agent.py", "Deployment and DevOps"),
+        "analytics": ("agents/analytics_agent.py", "Data analysis and insights")
+    }
+    
+    for agent_id, (path, desc) in agent_configs.items():
+        orchestrator.register_agent(agent_id, path, desc)
+    
+    return orchestrator
+
+@st.cache_resource
+def get_tools_manager(workspace_root):
+    """Custom tools manager with its catalog loaded, shared by every session and rerun"""
+    return CustomToolsManager(workspace_root)
+
+@st.cache_resource
+def get_background_writer():
+    """File writer thread shared by every session and rerun"""
+    return _BackgroundWriter()
+
+@st.cache_resource
+def get_ollama_executor():
+    """Worker threads for Ollama requests the page should not block on, shared by every session"""
+    return ThreadPoolExecutor(max_workers=OLLAMA_WORKERS)
+
+@st.cache_resource
+def get_ollama_session():
+    """Pooled HTTP session for Ollama calls, shared by every session and rerun"""
+    session = requests.Session()
+    retry = Retry(total=OLLAMA_CONNECT_RETRIES, connect=OLLAMA_CONNECT_RETRIES, read=0, status=0, backoff_factor=0.25)
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    # Bodies are pre-serialized with _dumps_bytes and sent as data=
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
 def render_project_creator():
     """Render the project creation interface with folder learning"""
     st.title("🚀 AI Project Creator")
@@ -541,8 +913,7 @@ def render_project_creator():
     
     # Initialize project manager
     workspace_root = os.path.expanduser("~/gringo_workspace")
-    if 'project_manager' not in st.session_state:
-        st.session_state.project_manager = FullProjectManager(workspace_root)
+    st.session_state.project_manager = get_project_manager(workspace_root)
     
     # Tab layout for different creation modes
     tab1, tab2, tab3 = st.tabs(["🆕 Create New", "📁 Learn from Folder", "🔗 Link Existing"])
@@ -572,10 +943,13 @@ def render_project_creator():
                     st.info(f"📂 Location: {result['path']}")
                     
                     if auto_run:
-                        run_result = st.session_state.project_manager.run_project(result['name'])
+                        output_placeholder = st.empty()
+                        run_result = st.session_state.project_manager.run_project(
+                            result['name'], on_output=output_placeholder.code
+                        )
                         if run_result.get('success'):
                             st.success("✅ Auto-run completed!")
-                            st.code(run_result['output'])
+                            output_placeholder.code(run_result['output'])
                     
                 except Exception as e:
                     st.error(f"❌ Failed to create project: {e}")
@@ -634,7 +1008,7 @@ def render_project_creator():
             help="Enter the full path to a folder you want to work with"
         )
         
-        if folder_path and os.path.exists(folder_path):
+        if folder_path and _cached_exists(folder_path):
             st.success(f"✅ Found folder: {folder_path}")
             
             col1, col2 = st.columns(2)
@@ -666,218 +1040,262 @@ def render_agent_control():
     
     # Initialize orchestrator
     workspace_root = os.path.expanduser("~/gringo_workspace")
-    if 'orchestrator' not in st.session_state:
-        st.session_state.orchestrator = MultiAgentOrchestrator(workspace_root)
-        
-        # Register all available agents
-        agent_configs = {
-            "planner": ("agents/planner_agent.py", "Task planning and breakdown"),
-            "refactor": ("agents/refactor_agent.py", "Code refactoring and optimization"),
-            "test_gen": ("agents/test_generator_agent.py", "Automated test generation"),
-            "doc_gen": ("agents/doc_generator_agent.py", "Documentation generation"),
-            "reviewer": ("agents/review_agent.py", "Code review and quality analysis"),
-            "security": ("agents/security_agent.py", "Security analysis and hardening"),
-            "performance": ("agents/performance_agent.py", "Performance optimization"),
-            "api": ("agents/api_agent.py", "API development and testing"),
-            "deploy": ("agents/deploy_agent.py", "Deployment and DevOps"),
-            "analytics": ("agents/analytics_agent.py", "Data analysis and insights")
-        }
-        
-        for agent_id, (path, desc) in agent_configs.items():
-            st.session_state.orchestrator.register_agent(agent_id, path, desc)
+    st.session_state.orchestrator = get_orchestrator(workspace_root)
     
     # Project-aware agent control
     tab1, tab2, tab3, tab4 = st.tabs(["🎯 Quick Actions", "🔄 Agent Pipelines", "📁 Project Analysis", "📊 Agent Status"])
     
+    # Get available projects
+    projects = get_available_projects(workspace_root)
+    
+    # Each tab is a fragment, so its widgets rerun only that tab
     with tab1:
-        st.subheader("AI Agent Quick Actions")
-        
-        # Get available projects
-        projects = get_available_projects(workspace_root)
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            selected_project = st.selectbox(
-                "Target Project (optional):",
-                ["All Projects"] + projects,
-                help="Choose a specific project or work globally"
-            )
-        
-        with col2:
-            action_type = st.selectbox(
-                "Quick Action:",
-                [
-                    "Analyze & Summarize",
-                    "Code Review",
-                    "Generate Tests",
-                    "Refactor Code",
-                    "Security Audit",
-                    "Performance Check",
-                    "Generate Docs",
-                    "Plan Improvements"
-                ]
-            )
-        
-        task_description = st.text_area(
-            "Describe the task:",
-            placeholder="Review the authentication module and suggest improvements",
-            height=100
-        )
-        
-        if st.button("🚀 Run Quick Action", type="primary") and task_description:
-            with st.spinner(f"🤖 Running {action_type}..."):
-                try:
-                    # Map action to appropriate agent
-                    agent_mapping = {
-                        "Analyze & Summarize": "analytics",
-                        "Code Review": "reviewer", 
-                        "Generate Tests": "test_gen",
-                        "Refactor Code": "refactor",
-                        "Security Audit": "security",
-                        "Performance Check": "performance",
-                        "Generate Docs": "doc_gen",
-                        "Plan Improvements": "planner"
-                    }
-                    
-                    agent_id = agent_mapping.get(action_type, "planner")
-                    
-                    # Add project context if selected
-                    context = task_description
-                    if selected_project != "All Projects":
-                        context = f"Project: {selected_project}\nTask: {task_description}"
-                    
-                    result = st.session_state.orchestrator.run_single_agent(agent_id, context)
-                    
-                    st.success(f"✅ {action_type} completed!")
-                    st.markdown("### Results:")
-                    st.markdown(result.output)
-                    
-                    if result.files_created:
-                        st.info(f"📁 Files created: {', '.join(result.files_created)}")
-                    
-                except Exception as e:
-                    st.error(f"❌ Action failed: {e}")
+        _render_quick_actions(projects)
     
     with tab2:
-        st.subheader("Multi-Agent Workflows")
+        _render_agent_pipelines(projects)
+    
+    with tab3:
+        _render_project_analysis(projects, workspace_root)
+    
+    with tab4:
+        _render_agent_status()
+
+@st.fragment
+def _render_quick_actions(projects):
+    """Quick Actions tab of the agent control center"""
+    st.subheader("AI Agent Quick Actions")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        selected_project = st.selectbox(
+            "Target Project (optional):",
+            ["All Projects"] + projects,
+            help="Choose a specific project or work globally"
+        )
+    
+    with col2:
+        action_type = st.selectbox(
+            "Quick Action:",
+            [
+                "Analyze & Summarize",
+                "Code Review",
+                "Generate Tests",
+                "Refactor Code",
+                "Security Audit",
+                "Performance Check",
+                "Generate Docs",
+                "Plan Improvements"
+            ]
+        )
+    
+    task_description = st.text_area(
+        "Describe the task:",
+        placeholder="Review the authentication module and suggest improvements",
+        height=100
+    )
+    
+    if st.button("🚀 Run Quick Action", type="primary") and task_description:
+        with st.spinner(f"🤖 Running {action_type}..."):
+            try:
+                # Map action to appropriate agent
+                agent_mapping = {
+                    "Analyze & Summarize": "analytics",
+                    "Code Review": "reviewer", 
+                    "Generate Tests": "test_gen",
+                    "Refactor Code": "refactor",
+                    "Security Audit": "security",
+                    "Performance Check": "performance",
+                    "Generate Docs": "doc_gen",
+                    "Plan Improvements": "planner"
+                }
+                
+                agent_id = agent_mapping.get(action_type, "planner")
+                
+                # Add project context if selected
+                context = task_description
+                if selected_project != "All Projects":
+                    context = f"Project: {selected_project}\nTask: {task_description}"
+                
+                result = st.session_state.orchestrator.run_single_agent(agent_id, context)
+                
+                st.success(f"✅ {action_type} completed!")
+                st.markdown("### Results:")
+                st.markdown(result.output)
+                
+                if result.artifacts:
+                    st.info(f"📁 Files created: {', '.join(result.artifacts)}")
+                
+            except Exception as e:
+                st.error(f"❌ Action failed: {e}")
+
+@st.fragment
+def _render_agent_pipelines(projects):
+    """Agent Pipelines tab of the agent control center"""
+    st.subheader("Multi-Agent Workflows")
+    
+    # Predefined pipelines
+    col1, col2 = st.columns(2)
+    with col1:
+        pipeline_type = st.selectbox(
+            "Workflow Type:",
+            list(PIPELINE_AGENTS) + ["Custom Pipeline"]
+        )
+    
+    with col2:
+        target_project = st.selectbox(
+            "Target Project:",
+            ["Select Project"] + projects,
+            help="Choose which project to process"
+        )
+    
+    pipeline_description = st.text_area(
+        "Pipeline Description:",
+        placeholder="Add user authentication, review security, generate tests, and create documentation",
+        height=100
+    )
+    
+    # Show pipeline preview, or let the user pick the agents for a custom one
+    if pipeline_type != "Custom Pipeline":
+        agent_sequence = get_pipeline_agents(pipeline_type)
+        st.info(f"🔄 Pipeline: {PIPELINE_PREVIEW[pipeline_type]}")
+    else:
+        agent_sequence = st.multiselect(
+            "Agents (run in the order picked):",
+            list(st.session_state.orchestrator.agents)
+        )
+    
+    if st.button("⚡ Run Pipeline", type="primary") and pipeline_description and target_project != "Select Project" and agent_sequence:
+        with st.spinner("🔄 Running multi-agent pipeline..."):
+            try:
+                # Add project context
+                context = f"Project: {target_project}\nObjective: {pipeline_description}"
+                
+                results = st.session_state.orchestrator.run_agent_pipeline(agent_sequence, context)
+                
+                st.success(f"✅ Pipeline completed! Ran {len(results)} agents")
+                
+                # Show results
+                for i, result in enumerate(results):
+                    with st.expander(f"Agent {i+1}: {result.agent_name}"):
+                        st.markdown(result.output)
+                        if result.artifacts:
+                            st.info(f"Files created: {', '.join(result.artifacts)}")
+                
+            except Exception as e:
+                st.error(f"❌ Pipeline failed: {e}")
+
+@st.fragment
+def _render_project_analysis(projects, workspace_root):
+    """Project Analysis tab of the agent control center"""
+    st.subheader("Project Deep Analysis")
+    
+    if projects:
+        analysis_project = st.selectbox("Project to Analyze:", projects)
         
-        # Predefined pipelines
-        col1, col2 = st.columns(2)
+        col1, col2, col3 = st.columns(3)
         with col1:
-            pipeline_type = st.selectbox(
-                "Workflow Type:",
-                [
-                    "Full Development Cycle",
-                    "Code Quality Audit", 
-                    "Security Hardening",
-                    "Performance Optimization",
-                    "Documentation Suite",
-                    "Custom Pipeline"
-                ]
-            )
+            if st.button("📊 Full Analysis"):
+                analyze_project_full(analysis_project, workspace_root)
         
         with col2:
-            target_project = st.selectbox(
-                "Target Project:",
-                ["Select Project"] + projects,
-                help="Choose which project to process"
-            )
-        
-        pipeline_description = st.text_area(
-            "Pipeline Description:",
-            placeholder="Add user authentication, review security, generate tests, and create documentation",
-            height=100
-        )
-        
-        # Show pipeline preview
-        if pipeline_type != "Custom Pipeline":
-            pipeline_agents = get_pipeline_agents(pipeline_type)
-            st.info(f"🔄 Pipeline: {' → '.join(pipeline_agents)}")
+            if st.button("🔍 Code Quality"):
+                analyze_project_quality(analysis_project, workspace_root)
         
-        if st.button("⚡ Run Pipeline", type="primary") and pipeline_description and target_project != "Select Project":
-            with st.spinner("🔄 Running multi-agent pipeline..."):
-                try:
-                    # Add project context
-                    context = f"Project: {target_project}\nObjective: {pipeline_description}"
-                    
-                    if pipeline_type == "Custom Pipeline":
-                        # Let AI decide which agents to use
-                        results = st.session_state.orchestrator.run_intelligent_pipeline(context)
-                    else:
-                        # Use predefined pipeline
-                        agent_sequence = get_pipeline_agents(pipeline_type)
-                        results = st.session_state.orchestrator.run_agent_pipeline(agent_sequence, context)
-                    
-                    st.success(f"✅ Pipeline completed! Ran {len(results)} agents")
-                    
-                    # Show results
-                    for i, result in enumerate(results):
-                        with st.expander(f"Agent {i+1}: {result.agent_id}"):
-                            st.markdown(result.output)
-                            if result.files_created:
-                                st.info(f"Files created: {', '.join(result.files_created)}")
-                    
-                except Exception as e:
-                    st.error(f"❌ Pipeline failed: {e}")
+        with col3:
+            if st.button("🚀 Optimization"):
+                analyze_project_optimization(analysis_project, workspace_root)
     
-    with tab3:
-        st.subheader("Project Deep Analysis")
-        
-        if projects:
-            analysis_project = st.selectbox("Project to Analyze:", projects)
-            
-            col1, col2, col3 = st.columns(3)
+    else:
+        st.info("📁 No projects found. Create or link a project first.")
+
+@st.fragment
+def _render_agent_status():
+    """Agent Status tab of the agent control center"""
+    st.subheader("Agent Health & Performance")
+    
+    # Agent status monitoring
+    agents = st.session_state.orchestrator.get_registered_agents()
+    
+    for agent_id, agent_info in agents.items():
+        with st.expander(f"🤖 {agent_id.title()} Agent"):
+            col1, col2 = st.columns(2)
             with col1:
-                if st.button("📊 Full Analysis"):
-                    analyze_project_full(analysis_project, workspace_root)
+                st.write(f"**Description:** {agent_info['description']}")
+                st.write(f"**Status:** {'✅ Ready' if agent_info['healthy'] else '❌ Error'}")
             
             with col2:
-                if st.button("🔍 Code Quality"):
-                    analyze_project_quality(analysis_project, workspace_root)
-            
-            with col3:
-                if st.button("🚀 Optimization"):
-                    analyze_project_optimization(analysis_project, workspace_root)
-        
-        else:
-            st.info("📁 No projects found. Create or link a project first.")
+                if st.button(f"Test {agent_id}", key=f"test_{agent_id}"):
+                    test_agent(agent_id)
+
+@st.fragment
+def _render_feature_pipeline(orchestrator):
+    """Feature Pipeline tab, rerun on its own while the pipeline runs"""
+    st.subheader("🚀 Feature Development Pipeline")
+    st.markdown("**Complete feature pipeline: Plan → Code → Test → Doc → Review**")
+    
+    feature_request = st.text_area(
+        "Describe the feature you want to develop:",
+        placeholder="Add user authentication with JWT tokens and role-based access control",
+        height=100
+    )
     
-    with tab4:
-        st.subheader("Agent Health & Performance")
-        
-        # Agent status monitoring
-        agents = st.session_state.orchestrator.get_registered_agents()
-        
-        for agent_id, agent_info in agents.items():
-            with st.expander(f"🤖 {agent_id.title()} Agent"):
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write(f"**Description:** {agent_info['description']}")
-                    st.write(f"**Status:** {'✅ Ready' if agent_info['healthy'] else '❌ Error'}")
+    if st.button("🚀 Run Feature Pipeline", type="primary"):
+        if feature_request:
+            with st.spinner("🏭 Running complete feature pipeline..."):
+                progress_bar = st.progress(0)
+                status_text = st.empty()
+                status_text.text("🧠 Phase 1: Planning and analysis...")
                 
-                with col2:
-                    if st.button(f"Test {agent_id}", key=f"test_{agent_id}"):
-                        test_agent(agent_id)
+                # The bar moves as each phase actually finishes
+                def on_progress(done, total, phase):
+                    progress_bar.progress(int(done / total * 100))
+                    status_text.text(f"✅ {phase} done ({done}/{total})")
+                
+                success = orchestrator.run_feature_pipeline(feature_request, on_progress=on_progress)
+                
+                if success:
+                    st.success("🎉 Feature pipeline completed successfully!")
+                else:
+                    st.warning("⚠️ Pipeline completed with issues")
 
 def get_available_projects(workspace_root):
-    """Get list of available projects"""
+    """Get list of available projects, re-reading the folder only when it has changed"""
     projects_dir = os.path.join(workspace_root, "projects")
-    if not os.path.exists(projects_dir):
+    try:
+        mtime = os.stat(projects_dir).st_mtime_ns
+    except FileNotFoundError:
         return []
     
-    return [d for d in os.listdir(projects_dir) 
-            if os.path.isdir(os.path.join(projects_dir, d))]
+    # Adding, removing or renaming a project updates the folder's mtime, from this or any session
+    cached = st.session_state.get('projects_cache')
+    if cached and cached[0] == (projects_dir, mtime):
+        return cached[1]
+    
+    with os.scandir(projects_dir) as entries:
+        projects = [entry.name for entry in entries if entry.is_dir()]
+    st.session_state['projects_cache'] = ((projects_dir, mtime), projects)
+    return projects
 
 def get_pipeline_agents(pipeline_type):
     """Get agent sequence for predefined pipelines"""
-    pipelines = {
-        "Full Development Cycle": ["planner", "refactor", "test_gen", "security", "doc_gen", "deploy"],
-        "Code Quality Audit": ["reviewer", "refactor", "test_gen", "performance"],
-        "Security Hardening": ["security", "reviewer", "test_gen", "doc_gen"], 
-        "Performance Optimization": ["performance", "refactor", "test_gen", "analytics"],
-        "Documentation Suite": ["analytics", "doc_gen", "reviewer"]
-    }
-    return pipelines.get(pipeline_type, ["planner"])
+    return PIPELINE_AGENTS.get(pipeline_type, ("planner",))
+
+def _render_agent_output(result, view):
+    """Render an agent's markdown output, offering very large outputs as a download instead"""
+    if len(result.output) <= MAX_RENDERED_OUTPUT:
+        st.markdown(result.output)
+        return
+    
+    st.info(f"📦 {result.agent_name} produced {len(result.output):,} characters - showing the start, download for the rest")
+    st.code(result.output[:OUTPUT_PREVIEW_CHARS])
+    st.download_button(
+        label="💾 Download Full Output",
+        data=result.output,
+        file_name=f"{result.agent_name}_{view}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
+        mime="text/markdown",
+        key=f"download_{view}_{result.agent_name}"
+    )
 
 def analyze_project_full(project_name, workspace_root):
     """Run comprehensive project analysis"""
@@ -887,14 +1305,14 @@ def analyze_project_full(project_name, workspace_root):
             context = f"Analyze project '{project_name}' comprehensively - architecture, code quality, security, performance, and documentation"
             
             agents = ["analytics", "reviewer", "security", "performance", "doc_gen"]
-            results = orchestrator.run_agent_pipeline(agents, context)
             
-            st.success("✅ Full analysis completed!")
+            # The agents are independent, so run them together and show each as soon as it finishes
+            placeholders = {agent: st.empty() for agent in agents}
+            for result in orchestrator.run_agent_pipeline_parallel(agents, context):
+                with placeholders[result.agent_name].expander(f"📋 {result.agent_name.title()} Analysis"):
+                    _render_agent_output(result, "full")
             
-            # Display comprehensive results
-            for result in results:
-                with st.expander(f"📋 {result.agent_id.title()} Analysis"):
-                    st.markdown(result.output)
+            st.success("✅ Full analysis completed!")
             
         except Exception as e:
             st.error(f"❌ Analysis failed: {e}")
@@ -906,11 +1324,11 @@ def analyze_project_quality(project_name, workspace_root):
             orchestrator = st.session_state.orchestrator
             context = f"Review code quality for project '{project_name}' - check for bugs, improvements, and best practices"
             
-            result = orchestrator.run_single_agent("reviewer", context)
+            result = orchestrator.submit_single_agent("reviewer", context).result()
             
             st.success("✅ Quality analysis completed!")
             st.markdown("### Code Quality Report:")
-            st.markdown(result.output)
+            _render_agent_output(result, "quality")
             
         except Exception as e:
             st.error(f"❌ Quality analysis failed: {e}")
@@ -923,13 +1341,14 @@ def analyze_project_optimization(project_name, workspace_root):
             context = f"Find optimization opportunities for project '{project_name}' - performance, architecture, and efficiency improvements"
             
             agents = ["performance", "refactor", "planner"]
-            results = orchestrator.run_agent_pipeline(agents, context)
             
-            st.success("✅ Optimization analysis completed!")
+            # The agents are independent, so run them together and show each as soon as it finishes
+            placeholders = {agent: st.empty() for agent in agents}
+            for result in orchestrator.run_agent_pipeline_parallel(agents, context):
+                with placeholders[result.agent_name].expander(f"⚡ {result.agent_name.title()} Recommendations"):
+                    _render_agent_output(result, "optimization")
             
-            for result in results:
-                with st.expander(f"⚡ {result.agent_id.title()} Recommendations"):
-                    st.markdown(result.output)
+            st.success("✅ Optimization analysis completed!")
             
         except Exception as e:
             st.error(f"❌ Optimization analysis failed: {e}")
@@ -946,8 +1365,6 @@ def test_agent(agent_id):
             
         except Exception as e:
             st.error(f"❌ {agent_id} agent test failed: {e}")
-        for name, (script, description) in agent_configs.items():
-            st.session_state.orchestrator.register_agent(name, script, description)
     
     # Create tabs
     tab1, tab2, tab3, tab4 = st.tabs([
@@ -1016,36 +1433,7 @@ def test_agent(agent_id):
                 st.error(f"❌ Error: {e}")
     
     with tab2:
-        st.subheader("🚀 Feature Development Pipeline")
-        st.markdown("**Complete feature pipeline: Plan → Code → Test → Doc → Review**")
-        
-        feature_request = st.text_area(
-            "Describe the feature you want to develop:",
-            placeholder="Add user authentication with JWT tokens and role-based access control",
-            height=100
-        )
-        
-        if st.button("🚀 Run Feature Pipeline", type="primary"):
-            if feature_request:
-                with st.spinner("🏭 Running complete feature pipeline..."):
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    
-                    status_text.text("🧠 Phase 1: Planning and analysis...")
-                    progress_bar.progress(20)
-                    
-                    status_text.text("🔧 Phase 2: Implementation...")
-                    progress_bar.progress(60)
-                    
-                    status_text.text("👥 Phase 3: Review and testing...")
-                    progress_bar.progress(100)
-                    
-                    success = st.session_state.orchestrator.run_feature_pipeline(feature_request)
-                    
-                    if success:
-                        st.success("🎉 Feature pipeline completed successfully!")
-                    else:
-                        st.warning("⚠️ Pipeline completed with issues")
+        _render_feature_pipeline(st.session_state.orchestrator)
     
     with tab3:
         st.subheader("📊 Agent Status Dashboard")
@@ -1079,12 +1467,56 @@ def test_agent(agent_id):
             col3.metric("Success Rate", f"{summary['success_rate']:.1f}%")
             
             st.markdown("**Recent Executions:**")
-            for result in reversed(st.session_state.orchestrator.results[-5:]):
+            for result in st.session_state.orchestrator.recent_results(5):
                 status = "✅" if result.success else "❌"
                 st.text(f"{status} {result.agent_name} - {result.timestamp[:19]}")
         else:
             st.info("No execution history yet.")
 
+@st.fragment
+def _render_tool_rows(tools_manager):
+    """Tool rows of the My Tools tab; their buttons rerun only this list"""
+    for tool in tools_manager.get_tools_by_category():
+        with st.container():
+            col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+            
+            with col1:
+                st.markdown(f"**🛠️ {tool['name']}**")
+                st.caption(tool['description'])
+                st.text(f"Language: {tool['language']} | Uses: {tool.get('usage_count', 0)}")
+            
+            with col2:
+                if st.button("🤖 AI Run", key=f"ai_run_{tool['id']}"):
+                    st.info(f"🤖 AI is running {tool['name']} for you...")
+                    result = tools_manager.run_tool(tool['id'])
+                    if result.get('success'):
+                        st.success("✅ AI execution completed!")
+                        st.code(result['output'])
+                        
+                        # Show save option after successful execution
+                        if st.button("💾 Keep This Tool", key=f"keep_{tool['id']}"):
+                            st.success(f"✅ Tool '{tool['name']}' marked as favorite!")
+                            st.balloons()
+                    else:
+                        st.error(f"❌ AI execution failed: {result.get('error')}")
+            
+            with col3:
+                if st.button("👁️ View", key=f"view_{tool['id']}"):
+                    with open(tool['file_path'], 'r') as f:
+                        code = f.read()
+                    with st.expander(f"📄 {tool['name']} Code", expanded=True):
+                        st.code(code, language=tool['language'])
+            
+            with col4:
+                if st.button("🗑️ Remove", key=f"remove_{tool['id']}"):
+                    if tools_manager.delete_tool(tool['id']):
+                        st.success(f"✅ Tool '{tool['name']}' removed!")
+                        st.rerun()
+                    else:
+                        st.error("❌ Failed to remove tool")
+            
+            st.markdown("---")
+
 def render_custom_tools_ai():
     """Render AI-powered custom tools interface"""
     st.title("🛠️ AI-Powered Custom Tools")
@@ -1094,11 +1526,16 @@ def render_custom_tools_ai():
     workspace_root = os.path.expanduser("~/gringo_workspace")
     if 'tools_manager' not in st.session_state:
         try:
-            st.session_state.tools_manager = CustomToolsManager(workspace_root)
+            st.session_state.tools_manager = get_tools_manager(workspace_root)
         except:
             # Fallback if CustomToolsManager not available
             st.session_state.tools_manager = None
     
+    # Warm the model once per session while the user is still typing
+    if not st.session_state.get('ollama_warmed'):
+        st.session_state['ollama_warmed'] = True
+        prewarm_ollama()
+    
     # Create tabs
     tab1, tab2, tab3, tab4 = st.tabs([
         "🤖 AI Tool Creator",
@@ -1142,120 +1579,28 @@ Requirements:
 - Include usage examples
 - Add command line arguments if needed
 
-Please provide:
-1. A good name for the tool
-2. The complete code
-3. Brief usage instructions"""
+Respond as JSON: {{"name": "<short snake_case tool name>", "code": "<the complete code>", "usage": "<brief usage instructions>"}}"""
                 
                 try:
-                    import requests
-                    response = requests.post(
-                        "http://localhost:11434/api/generate",
-                        json={
-                            "model": "llama3", 
-                            "prompt": ai_prompt,
-                            "stream": False
-                        },
-                        timeout=60
-                    )
+                    # Stream tokens as they arrive; the full text is returned for parsing
+                    stop_event = _ollama_stop_button("stop_generate_tool")
+                    with st.expander("🤖 AI Response", expanded=True):
+                        ai_response = st.write_stream(ollama_stream_cached(ai_prompt, stop_event=stop_event, format="json"))
                     
-                    if response.status_code == 200:
-                        ai_response = response.json().get('response', '')
-                        
+                    if ai_response:
                         # Parse AI response to extract tool details
                         tool_name, tool_code, usage_info = parse_ai_tool_response(ai_response, tool_description)
                         
-                        # Display the generated tool
-                        st.success("✅ AI has created your tool!")
-                        
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.markdown(f"**🔧 Tool Name:** {tool_name}")
-                            st.markdown(f"**📝 Description:** {tool_description[:100]}...")
-                        with col2:
-                            st.markdown(f"**💻 Language:** {tool_language}")
-                            st.markdown(f"**📅 Created:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-                        
-                        # Show the code
-                        with st.expander("📄 Generated Code", expanded=True):
-                            st.code(tool_code, language=tool_language.lower())
-                        
-                        # Save and run options
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            if st.button("💾 Save Tool"):
-                                if st.session_state.tools_manager:
-                                    try:
-                                        result = st.session_state.tools_manager.create_tool(
-                                            name=tool_name,
-                                            description=tool_description,
-                                            category="ai_generated",
-                                            language=tool_language.lower(),
-                                            code=tool_code
-                                        )
-                                        st.success(f"✅ Tool saved as '{tool_name}'")
-                                    except Exception as e:
-                                        st.error(f"❌ Save failed: {e}")
-                                else:
-                                    # Fallback save
-                                    save_tool_fallback(tool_name, tool_code, tool_language, workspace_root)
-                                    st.success(f"✅ Tool saved to workspace")
-                        
-                        with col2:
-                            if st.button("▶️ Run Now"):
-                                run_result = execute_tool_code(tool_code, tool_language, workspace_root)
-                                if run_result['success']:
-                                    st.success("✅ Tool executed successfully!")
-                                    st.code(run_result['output'])
-                                    
-                                    # Save after successful execution
-                                    st.session_state['last_executed_tool'] = {
-                                        'name': tool_name,
-                                        'code': tool_code,
-                                        'language': tool_language,
-                                        'description': tool_description,
-                                        'output': run_result['output']
-                                    }
-                                    
-                                    # Show save option after successful run
-                                    if st.button("💾 Save This Tool", key="save_after_run"):
-                                        if st.session_state.tools_manager:
-                                            try:
-                                                result = st.session_state.tools_manager.create_tool(
-                                                    name=tool_name,
-                                                    description=tool_description,
-                                                    category="ai_generated",
-                                                    language=tool_language.lower(),
-                                                    code=tool_code
-                                                )
-                                                st.success(f"✅ Tool '{tool_name}' saved to library!")
-                                            except Exception as e:
-                                                st.error(f"❌ Save failed: {e}")
-                                        else:
-                                            save_tool_fallback(tool_name, tool_code, tool_language, workspace_root)
-                                            st.success(f"✅ Tool '{tool_name}' saved to workspace!")
-                                else:
-                                    st.error(f"❌ Execution failed: {run_result['error']}")
-                                    st.info("💡 Try fixing the code or ask AI to improve it")
-                        
-                        with col3:
-                            if st.button("🔄 Improve Tool"):
-                                st.session_state['improve_tool'] = True
-                                st.session_state['tool_to_improve'] = tool_code
-                        
-                        # Auto-run if requested
-                        if auto_run:
-                            st.info("🔄 Auto-running tool...")
-                            run_result = execute_tool_code(tool_code, tool_language, workspace_root)
-                            if run_result['success']:
-                                st.success("✅ Auto-run completed!")
-                                st.code(run_result['output'])
-                        
-                        # Show usage instructions
-                        if usage_info:
-                            with st.expander("📖 Usage Instructions"):
-                                st.markdown(usage_info)
+                        # Kept across reruns so the Save/Run/Improve buttons below still have the tool
+                        st.session_state['generated_tool'] = {
+                            'name': tool_name,
+                            'code': tool_code,
+                            'language': tool_language,
+                            'description': tool_description,
+                            'usage': usage_info,
+                            'created': datetime.now().strftime('%Y-%m-%d %H:%M'),
+                            'run': execute_tool_code(tool_code, tool_language, workspace_root) if auto_run else None
+                        }
                     
                     else:
                         st.error("❌ AI service unavailable")
@@ -1264,6 +1609,61 @@ Please provide:
                     st.error(f"❌ AI tool generation failed: {e}")
                     st.info("💡 Make sure Ollama is running: `ollama serve`")
         
+        # Latest generated tool, shown until the next generation
+        generated_tool = st.session_state.get('generated_tool')
+        if generated_tool:
+            st.success("✅ AI has created your tool!")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown(f"**🔧 Tool Name:** {generated_tool['name']}")
+                st.markdown(f"**📝 Description:** {generated_tool['description'][:100]}...")
+            with col2:
+                st.markdown(f"**💻 Language:** {generated_tool['language']}")
+                st.markdown(f"**📅 Created:** {generated_tool['created']}")
+            
+            # Show the code
+            with st.expander("📄 Generated Code", expanded=True):
+                st.code(generated_tool['code'], language=generated_tool['language'].lower())
+            
+            # Save and run options
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                _save_generated_tool(
+                    generated_tool['name'], generated_tool['description'], generated_tool['language'],
+                    generated_tool['code'], workspace_root, "💾 Save Tool", "save_generated_tool"
+                )
+            
+            with col2:
+                if st.button("▶️ Run Now"):
+                    # Live output while it runs; the full result is shown below once it finishes
+                    live_output = st.empty()
+                    generated_tool['run'] = execute_tool_code(
+                        generated_tool['code'], generated_tool['language'], workspace_root, on_output=live_output.code
+                    )
+                    live_output.empty()
+            
+            with col3:
+                if st.button("🔄 Improve Tool"):
+                    st.session_state['improve_tool'] = True
+                    st.session_state['tool_to_improve'] = generated_tool['code']
+            
+            # Result of the last Run Now or auto-run
+            run_result = generated_tool['run']
+            if run_result:
+                if run_result['success']:
+                    st.success("✅ Tool executed successfully!")
+                    st.code(run_result['output'])
+                else:
+                    st.error(f"❌ Execution failed: {run_result['error']}")
+                    st.info("💡 Try fixing the code or ask AI to improve it")
+            
+            # Show usage instructions
+            if generated_tool['usage']:
+                with st.expander("📖 Usage Instructions"):
+                    st.markdown(generated_tool['usage'])
+        
         # Tool improvement section
         if st.session_state.get('improve_tool', False):
             st.markdown("---")
@@ -1289,21 +1689,12 @@ Please provide the improved version with:
 - Better documentation"""
 
                     try:
-                        import requests
-                        response = requests.post(
-                            "http://localhost:11434/api/generate",
-                            json={
-                                "model": "llama3",
-                                "prompt": improve_prompt,
-                                "stream": False
-                            },
-                            timeout=60
-                        )
+                        stop_event = _ollama_stop_button("stop_improve_tool")
+                        with st.expander("🤖 Improved Version", expanded=True):
+                            improved_code = st.write_stream(ollama_stream(improve_prompt, stop_event=stop_event))
                         
-                        if response.status_code == 200:
-                            improved_code = response.json().get('response', '')
+                        if improved_code:
                             st.success("✅ Tool improved!")
-                            st.code(improved_code, language=tool_language.lower())
                             
                             if st.button("💾 Save Improved Version"):
                                 st.session_state['tool_to_improve'] = improved_code
@@ -1330,123 +1721,114 @@ Please provide the improved version with:
         
         # AI tool selection and execution
         if st.button("🤖 AI: Find and Run Tool", type="primary") and task_description:
-            with st.spinner("🤖 AI is analyzing your request and finding the best tool..."):
-                
-                # Get available tools
-                available_tools = []
-                if st.session_state.tools_manager:
-                    available_tools = st.session_state.tools_manager.get_tools_by_category()
-                
-                # AI tool recommendation
-                recommend_prompt = f"""I need to: {task_description}
+            # Get available tools
+            available_tools = []
+            if st.session_state.tools_manager:
+                available_tools = st.session_state.tools_manager.get_tools_by_category()
+            
+            # AI tool recommendation
+            recommend_prompt = f"""I need to: {task_description}
 
 Available tools: {[tool.get('name', 'Unknown') + ': ' + tool.get('description', '') for tool in available_tools[:5]]}
 
 Please either:
 1. Recommend which existing tool to use and how to configure it
-2. Or create a simple script to accomplish this task
+2. Or create a simple Python script to accomplish this task
 
-Respond with either:
-- EXISTING_TOOL: [tool_name] with parameters [parameters]
-- NEW_SCRIPT: [code to accomplish the task]"""
+Respond with a single JSON object:
+{{"action": "existing" or "new", "tool_name": "<existing tool name or empty>", "params": "<parameters for the existing tool or empty>", "script": "<complete Python script or empty>"}}"""
 
-                try:
-                    import requests
-                    response = requests.post(
-                        "http://localhost:11434/api/generate",
-                        json={
-                            "model": "llama3",
-                            "prompt": recommend_prompt,
-                            "stream": False
-                        },
-                        timeout=30
-                    )
-                    
-                    if response.status_code == 200:
-                        ai_recommendation = response.json().get('response', '')
-                        
-                        if "EXISTING_TOOL:" in ai_recommendation:
-                            # AI recommends existing tool
-                            st.success("🎯 AI found a perfect tool for your task!")
-                            st.info(ai_recommendation)
-                            
-                            # Extract tool name and run it
-                            tool_name = extract_tool_name(ai_recommendation)
-                            if tool_name and st.session_state.tools_manager:
-                                if st.button(f"▶️ Run {tool_name}"):
-                                    # Find and run the tool
-                                    tools = st.session_state.tools_manager.get_tools_by_category()
-                                    target_tool = next((t for t in tools if t['name'].lower() == tool_name.lower()), None)
-                                    if target_tool:
-                                        result = st.session_state.tools_manager.run_tool(target_tool['id'])
-                                        if result.get('success'):
-                                            st.success("✅ Tool executed successfully!")
-                                            st.code(result['output'])
-                                        else:
-                                            st.error(f"❌ Tool failed: {result.get('error')}")
-                        
-                        elif "NEW_SCRIPT:" in ai_recommendation:
-                            # AI created new script
-                            st.success("🚀 AI created a custom script for your task!")
-                            
-                            # Extract and display code
-                            script_code = extract_script_code(ai_recommendation)
-                            st.code(script_code, language='python')
-                            
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                if st.button("▶️ Run Script"):
-                                    result = execute_tool_code(script_code, 'python', workspace_root)
-                                    if result['success']:
-                                        st.success("✅ Script executed successfully!")
-                                        st.code(result['output'])
-                                        
-                                        # Save after successful execution
-                                        st.session_state['last_executed_script'] = {
-                                            'code': script_code,
-                                            'output': result['output'],
-                                            'task': task_description
-                                        }
-                                        
-                                        # Show save option
-                                        if st.button("💾 Save This Script as Tool", key="save_script_after_run"):
-                                            script_name = f"ai_task_{datetime.now().strftime('%m%d_%H%M%S')}"
-                                            if st.session_state.tools_manager:
-                                                try:
-                                                    result = st.session_state.tools_manager.create_tool(
-                                                        name=script_name,
-                                                        description=f"AI-generated for: {task_description}",
-                                                        category="ai_generated",
-                                                        language="python",
-                                                        code=script_code
-                                                    )
-                                                    st.success(f"✅ Script saved as '{script_name}'!")
-                                                except Exception as e:
-                                                    st.error(f"❌ Save failed: {e}")
-                                            else:
-                                                save_tool_fallback(script_name, script_code, 'python', workspace_root)
-                                                st.success(f"✅ Script saved as '{script_name}'!")
-                                    else:
-                                        st.error(f"❌ Script failed: {result['error']}")
-                                        st.info("💡 Try modifying the task description for better results")
-                            
-                            with col2:
-                                if st.button("💾 Save as Tool"):
-                                    script_name = f"ai_task_{datetime.now().strftime('%H%M%S')}"
-                                    save_tool_fallback(script_name, script_code, 'python', workspace_root)
-                                    st.success("✅ Script saved as tool!")
-                        
-                        else:
-                            # General AI response
-                            st.info("🤖 AI Response:")
-                            st.markdown(ai_recommendation)
+            # JSON mode returns the decision and any script in one round trip; it runs in the
+            # background so the rest of the page stays usable while the model works
+            submit_ai_request('quick_plan', recommend_prompt, timeout=30, format="json")
+            st.session_state['quick_plan_task'] = task_description
+            st.session_state['quick_plan'] = None
+        
+        _await_ai_request('quick_plan', "🤖 AI is analyzing your request and finding the best tool...")
+        finished = take_ai_result('quick_plan')
+        if finished:
+            try:
+                ai_recommendation = finished.result()
+                
+                if ai_recommendation is not None:
+                    try:
+                        plan = json.loads(ai_recommendation)
+                    except ValueError:
+                        plan = None
+                    if not isinstance(plan, dict):
+                        plan = {}
                     
-                    else:
-                        st.error("❌ AI service unavailable")
+                    # Kept across reruns so the Run/Save buttons below still have the plan
+                    st.session_state['quick_plan'] = dict(
+                        plan, task=st.session_state['quick_plan_task'], raw=ai_recommendation, run=None
+                    )
                 
-                except Exception as e:
-                    st.error(f"❌ AI analysis failed: {e}")
+                else:
+                    st.error("❌ AI service unavailable")
+            
+            except Exception as e:
+                st.error(f"❌ AI analysis failed: {e}")
+        
+        # Latest AI plan, shown until the next request
+        quick_plan = st.session_state.get('quick_plan')
+        if quick_plan:
+            if quick_plan.get('action') == "existing" and quick_plan.get('tool_name'):
+                # AI recommends existing tool
+                st.success("🎯 AI found a perfect tool for your task!")
+                tool_name = str(quick_plan['tool_name']).strip()
+                st.info(f"🔧 {tool_name}" + (f" with parameters: {quick_plan['params']}" if quick_plan.get('params') else ""))
+                
+                # Run the recommended tool
+                if tool_name and st.session_state.tools_manager:
+                    if st.button(f"▶️ Run {tool_name}"):
+                        # Find and run the tool
+                        tools = st.session_state.tools_manager.get_tools_by_category()
+                        target_tool = next((t for t in tools if t['name'].lower() == tool_name.lower()), None)
+                        if target_tool:
+                            result = st.session_state.tools_manager.run_tool(target_tool['id'])
+                            if result.get('success'):
+                                st.success("✅ Tool executed successfully!")
+                                st.code(result['output'])
+                            else:
+                                st.error(f"❌ Tool failed: {result.get('error')}")
+            
+            elif quick_plan.get('action') == "new" and quick_plan.get('script'):
+                # AI created new script
+                st.success("🚀 AI created a custom script for your task!")
+                
+                # Display the generated code
+                script_code = str(quick_plan['script']).strip()
+                st.code(script_code, language='python')
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    if st.button("▶️ Run Script"):
+                        # Live output while it runs; the full result is shown below once it finishes
+                        live_output = st.empty()
+                        quick_plan['run'] = execute_tool_code(script_code, 'python', workspace_root, on_output=live_output.code)
+                        live_output.empty()
+                
+                with col2:
+                    _save_generated_tool(
+                        f"ai_task_{datetime.now().strftime('%m%d_%H%M%S')}", f"AI-generated for: {quick_plan['task']}",
+                        'python', script_code, workspace_root, "💾 Save as Tool", "save_quick_script"
+                    )
+                
+                # Result of the last Run Script
+                run_result = quick_plan['run']
+                if run_result:
+                    if run_result['success']:
+                        st.success("✅ Script executed successfully!")
+                        st.code(run_result['output'])
+                    else:
+                        st.error(f"❌ Script failed: {run_result['error']}")
+                        st.info("💡 Try modifying the task description for better results")
+            
+            else:
+                # General AI response
+                st.info("🤖 AI Response:")
+                st.markdown(quick_plan['raw'])
         
         # Quick actions
         st.markdown("---")
@@ -1474,17 +1856,27 @@ Respond with either:
             # Simple task execution
             if "organize files" in quick_task:
                 organize_script = """
+import errno
 import os
 import shutil
 from pathlib import Path
 
+def move_file(src, dst):
+    # A rename within the same filesystem; copy and delete only across devices
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
 def organize_files():
     for file in Path('.').iterdir():
         if file.is_file() and file.suffix:
             ext_dir = Path(file.suffix[1:])
             ext_dir.mkdir(exist_ok=True)
             try:
-                shutil.move(str(file), str(ext_dir / file.name))
+                move_file(str(file), str(ext_dir / file.name))
                 print(f"Moved {file.name} to {ext_dir}/")
             except:
                 print(f"Could not move {file.name}")
@@ -1492,8 +1884,9 @@ def organize_files():
 organize_files()
 print("File organization complete!")
 """
-                result = execute_tool_code(organize_script, 'python', workspace_root)
-                st.code(result['output'] if result['success'] else result['error'])
+                output_placeholder = st.empty()
+                result = execute_tool_code(organize_script, 'python', workspace_root, on_output=output_placeholder.code)
+                output_placeholder.code(result['output'] if result['success'] else result['error'])
             
             st.session_state['quick_task'] = None
     
@@ -1507,46 +1900,8 @@ print("File organization complete!")
             if tools:
                 st.markdown(f"**🔧 {len(tools)} Tools Available:**")
                 
-                for tool in tools:
-                    with st.container():
-                        col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-                        
-                        with col1:
-                            st.markdown(f"**🛠️ {tool['name']}**")
-                            st.caption(tool['description'])
-                            st.text(f"Language: {tool['language']} | Uses: {tool.get('usage_count', 0)}")
-                        
-                        with col2:
-                            if st.button("🤖 AI Run", key=f"ai_run_{tool['id']}"):
-                                st.info(f"🤖 AI is running {tool['name']} for you...")
-                                result = st.session_state.tools_manager.run_tool(tool['id'])
-                                if result.get('success'):
-                                    st.success("✅ AI execution completed!")
-                                    st.code(result['output'])
-                                    
-                                    # Show save option after successful execution
-                                    if st.button("💾 Keep This Tool", key=f"keep_{tool['id']}"):
-                                        st.success(f"✅ Tool '{tool['name']}' marked as favorite!")
-                                        st.balloons()
-                                else:
-                                    st.error(f"❌ AI execution failed: {result.get('error')}")
-                        
-                        with col3:
-                            if st.button("👁️ View", key=f"view_{tool['id']}"):
-                                with open(tool['file_path'], 'r') as f:
-                                    code = f.read()
-                                with st.expander(f"📄 {tool['name']} Code", expanded=True):
-                                    st.code(code, language=tool['language'])
-                        
-                        with col4:
-                            if st.button("🗑️ Remove", key=f"remove_{tool['id']}"):
-                                if st.session_state.tools_manager.delete_tool(tool['id']):
-                                    st.success(f"✅ Tool '{tool['name']}' removed!")
-                                    st.rerun()
-                                else:
-                                    st.error("❌ Failed to remove tool")
-                        
-                        st.markdown("---")
+                # Each row's buttons rerun only the tool list
+                _render_tool_rows(st.session_state.tools_manager)
                 
                 # Batch operations
                 st.markdown("---")
@@ -1556,28 +1911,30 @@ print("File organization complete!")
                 
                 with col1:
                     if st.button("🧹 Remove Unused Tools"):
-                        unused_tools = [tool for tool in tools if tool.get('usage_count', 0) == 0]
-                        if unused_tools:
-                            st.info(f"Found {len(unused_tools)} unused tools")
-                            if st.button("Confirm Removal", key="confirm_remove_unused"):
-                                for tool in unused_tools:
-                                    st.session_state.tools_manager.delete_tool(tool['id'])
-                                st.success(f"✅ Removed {len(unused_tools)} unused tools!")
-                                st.rerun()
+                        unused_ids = [tool['id'] for tool in tools if tool.get('usage_count', 0) == 0]
+                        if unused_ids:
+                            # Kept across reruns so the confirm button below is still drawn when clicked
+                            st.session_state['confirm_remove_unused'] = unused_ids
                         else:
                             st.info("No unused tools found!")
+                    
+                    unused_ids = st.session_state.get('confirm_remove_unused')
+                    if unused_ids:
+                        st.info(f"Found {len(unused_ids)} unused tools")
+                        if st.button("Confirm Removal", key="confirm_remove_unused_button"):
+                            st.session_state['confirm_remove_unused'] = None
+                            removed = st.session_state.tools_manager.bulk_delete(unused_ids)
+                            st.success(f"✅ Removed {removed} unused tools!")
+                            st.rerun()
+                        if st.button("Cancel", key="cancel_remove_unused"):
+                            st.session_state['confirm_remove_unused'] = None
+                            st.rerun()
                 
                 with col2:
                     if st.button("📊 Export All Tools"):
-                        export_data = []
-                        for tool in tools:
-                            export_data.append(st.session_state.tools_manager.export_tool(tool['id']))
-                        
-                        import json
-                        export_json = json.dumps(export_data, indent=2)
                         st.download_button(
                             label="💾 Download Tools Backup",
-                            data=export_json,
+                            data=_export_tools_json(st.session_state.tools_manager, tools),
                             file_name=f"gringo_tools_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                             mime="application/json"
                         )
@@ -1585,17 +1942,23 @@ print("File organization complete!")
                 with col3:
                     if st.button("📈 Tool Usage Stats"):
                         st.markdown("**📊 Usage Statistics:**")
-                        total_usage = sum(tool.get('usage_count', 0) for tool in tools)
-                        most_used = max(tools, key=lambda x: x.get('usage_count', 0)) if tools else None
+                        # Total and most used tool in one pass (first tool wins ties, like max)
+                        total_usage = 0
+                        most_used, most_used_count = None, -1
+                        for tool in tools:
+                            uses = tool.get('usage_count', 0)
+                            total_usage += uses
+                            if uses > most_used_count:
+                                most_used, most_used_count = tool, uses
                         
                         st.metric("Total Tool Executions", total_usage)
                         if most_used:
-                            st.metric("Most Used Tool", f"{most_used['name']} ({most_used.get('usage_count', 0)} uses)")
+                            st.metric("Most Used Tool", f"{most_used['name']} ({most_used_count} uses)")
                         
                         # Show usage chart
-                        usage_data = [(tool['name'], tool.get('usage_count', 0)) for tool in tools[-5:]]
-                        if usage_data:
-                            st.bar_chart({name: count for name, count in usage_data})
+                        usage_chart = {tool['name']: tool.get('usage_count', 0) for tool in tools[-5:]}
+                        if usage_chart:
+                            st.bar_chart(usage_chart)
             else:
                 st.info("No tools created yet. Use the AI Tool Creator to get started!")
         else:
@@ -1605,7 +1968,7 @@ print("File organization complete!")
             if 'executed_tools_history' in st.session_state:
                 st.markdown("**🕒 Recent Executions (Can Save):**")
                 
-                for i, executed_tool in enumerate(st.session_state['executed_tools_history'][-3:]):
+                for i, executed_tool in enumerate(list(st.session_state['executed_tools_history'])[-3:]):
                     with st.expander(f"💻 {executed_tool['name']} - {executed_tool['timestamp'][:19]}"):
                         st.text(f"Description: {executed_tool['description']}")
                         st.text(f"Language: {executed_tool['language']}")
@@ -1614,13 +1977,13 @@ print("File organization complete!")
                         col1, col2 = st.columns(2)
                         with col1:
                             if st.button(f"💾 Save Tool", key=f"save_history_{i}"):
-                                save_tool_fallback(
+                                future = save_tool_fallback(
                                     executed_tool['name'], 
                                     executed_tool['code'], 
                                     executed_tool['language'], 
                                     workspace_root
                                 )
-                                st.success(f"✅ Tool '{executed_tool['name']}' saved!")
+                                _report_fallback_save(future, executed_tool['name'])
                         
                         with col2:
                             if st.button(f"🗑️ Remove from History", key=f"remove_history_{i}"):
@@ -1634,12 +1997,10 @@ print("File organization complete!")
         
         # AI-powered tool suggestions
         if st.button("🤖 Get AI Tool Suggestions"):
-            with st.spinner("🤖 AI is analyzing your workflow..."):
-                
-                # Analyze current workspace
-                workspace_analysis = analyze_workspace(workspace_root)
-                
-                suggestion_prompt = f"""Based on this workspace analysis: {workspace_analysis}
+            # Analyze current workspace
+            workspace_analysis = analyze_workspace(workspace_root)
+            
+            suggestion_prompt = f"""Based on this workspace analysis: {workspace_analysis}
 
 Suggest 5 useful development tools that would help with this workflow. For each tool, provide:
 1. Tool name
@@ -1649,41 +2010,75 @@ Suggest 5 useful development tools that would help with this workflow. For each
 
 Focus on practical tools for productivity and automation."""
 
-                try:
-                    import requests
-                    response = requests.post(
-                        "http://localhost:11434/api/generate",
-                        json={
-                            "model": "llama3",
-                            "prompt": suggestion_prompt,
-                            "stream": False
-                        },
-                        timeout=30
-                    )
-                    
-                    if response.status_code == 200:
-                        suggestions = response.json().get('response', '')
-                        st.success("🎯 AI Tool Suggestions:")
-                        st.markdown(suggestions)
-                        
-                        # Quick create buttons
-                        st.markdown("**⚡ Quick Create:**")
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            if st.button("🔧 Create Tool 1"):
-                                st.session_state['ai_create_tool'] = "first suggested tool"
-                        
-                        with col2:
-                            if st.button("🔧 Create Tool 2"):
-                                st.session_state['ai_create_tool'] = "second suggested tool"
-                        
-                        with col3:
-                            if st.button("🔧 Create Tool 3"):
-                                st.session_state['ai_create_tool'] = "third suggested tool"
-                    
-                except Exception as e:
-                    st.error(f"❌ AI suggestions failed: {e}")
+            submit_ai_request('suggestions', suggestion_prompt, timeout=30, options={"num_predict": SUGGESTIONS_NUM_PREDICT})
+            st.session_state['ai_suggestions'] = None
+            st.session_state['suggested_tools'] = {}
+        
+        _await_ai_request('suggestions', "🤖 AI is analyzing your workflow...")
+        finished = take_ai_result('suggestions')
+        if finished:
+            try:
+                st.session_state['ai_suggestions'] = finished.result()
+            except Exception as e:
+                st.error(f"❌ AI suggestions failed: {e}")
+        
+        # Latest suggestions, shown until the next request
+        suggestions = st.session_state.get('ai_suggestions')
+        if suggestions is not None:
+            st.success("🎯 AI Tool Suggestions:")
+            st.markdown(suggestions)
+            
+            # Quick create buttons; any of them drafts all three tools at once
+            st.markdown("**⚡ Quick Create:**")
+            ordinals = ("first", "second", "third")
+            for i, col in enumerate(st.columns(3)):
+                with col:
+                    if st.button(f"🔧 Create Tool {i + 1}"):
+                        st.session_state['ai_create_tool'] = i
+                        st.session_state['suggested_tools'] = {}
+                        # Submitted together, so the executor runs the three prompts concurrently
+                        for n, ordinal in enumerate(ordinals):
+                            create_prompt = f"""From these tool suggestions:
+{suggestions}
+
+Create a python tool for the {ordinal} suggested tool.
+
+Requirements:
+- Include clear comments and documentation
+- Add error handling
+- Add command line arguments if needed
+
+Respond as JSON: {{"name": "<short snake_case tool name>", "code": "<the complete code>", "usage": "<brief usage instructions>"}}"""
+                            submit_ai_request(f'suggested_tool_{n}', create_prompt, format="json")
+            
+            # Drafted tools, each collected as its request finishes
+            suggested_tools = st.session_state.setdefault('suggested_tools', {})
+            for n, ordinal in enumerate(ordinals):
+                key = f'suggested_tool_{n}'
+                _await_ai_request(key, f"🤖 AI is creating the {ordinal} suggested tool...")
+                finished = take_ai_result(key)
+                if finished:
+                    try:
+                        ai_response = finished.result()
+                    except Exception as e:
+                        st.error(f"❌ Creating the {ordinal} suggested tool failed: {e}")
+                        continue
+                    if ai_response:
+                        tool_name, tool_code, usage_info = parse_ai_tool_response(ai_response, f"{ordinal} suggested tool")
+                        suggested_tools[n] = {'name': tool_name, 'code': tool_code, 'usage': usage_info}
+                    else:
+                        st.error("❌ AI service unavailable")
+                
+                tool = suggested_tools.get(n)
+                if tool:
+                    with st.expander(f"🔧 {tool['name']}", expanded=n == st.session_state.get('ai_create_tool')):
+                        st.code(tool['code'], language='python')
+                        if tool['usage']:
+                            st.caption(tool['usage'])
+                        _save_generated_tool(
+                            tool['name'], f"The {ordinal} AI-suggested tool", "Python",
+                            tool['code'], workspace_root, "💾 Save Tool", f"save_{key}"
+                        )
         
         # Workflow-based suggestions
         st.markdown("---")
@@ -1704,92 +2099,219 @@ Focus on practical tools for productivity and automation."""
                 st.info(f"🤖 AI will create a {category.lower()} tool for you!")
 
 # Helper functions for AI tool processing
+def ollama_generate(prompt, model="llama3", timeout=60, format=None, session=None, options=None):
+    """Send one prompt to the local Ollama server and return its text, or None if it answers non-200"""
+    payload = {"model": model, "prompt": prompt, "stream": False, "keep_alive": OLLAMA_KEEP_ALIVE}
+    if format:
+        payload["format"] = format
+    if options:
+        payload["options"] = options
+    response = (session or get_ollama_session()).post(OLLAMA_GENERATE_URL, data=_dumps_bytes(payload), timeout=timeout)
+    if response.status_code != 200:
+        return None
+    return response.json().get('response', '')
+
+def prewarm_ollama(model="llama3"):
+    """Load the model in a background thread so the first real request skips the cold start"""
+    session = get_ollama_session()
+    
+    def warm():
+        # An empty prompt only loads the model; failures just mean the first request is cold
+        try:
+            session.post(
+                OLLAMA_GENERATE_URL,
+                data=_dumps_bytes({"model": model, "prompt": "", "keep_alive": OLLAMA_KEEP_ALIVE}),
+                timeout=120
+            )
+        except Exception:
+            pass
+    
+    threading.Thread(target=warm, daemon=True).start()
+
+def submit_ai_request(key, prompt, **kwargs):
+    """Start ollama_generate in the background, replacing any earlier request stored under key"""
+    future = get_ollama_executor().submit(ollama_generate, prompt, session=get_ollama_session(), **kwargs)
+    st.session_state.setdefault('pending_ai', {})[key] = future
+    st.session_state.setdefault('finished_ai', {}).pop(key, None)
+
+def _await_ai_request(key, message):
+    """Poll the request under key from an auto-rerunning fragment while it is pending"""
+    if key in st.session_state.get('pending_ai', {}):
+        _poll_ai_request(key, message)
+
+@st.fragment(run_every=OLLAMA_POLL_SECONDS)
+def _poll_ai_request(key, message):
+    """Show message until the request finishes, then rerun the page once; stops polling when no longer called"""
+    future = st.session_state.get('pending_ai', {}).get(key)
+    if future is None:
+        return
+    
+    if not future.done():
+        st.info(message)
+        return
+    
+    del st.session_state['pending_ai'][key]
+    st.session_state.setdefault('finished_ai', {})[key] = future
+    st.rerun()
+
+def take_ai_result(key):
+    """Pop the finished future for key, or None if no request under key finished since the last call"""
+    return st.session_state.get('finished_ai', {}).pop(key, None)
+
+def ollama_stream(prompt, model="llama3", timeout=60, stop_event=None, format=None):
+    """Yield the Ollama response as it is generated; yields nothing if the server answers non-200"""
+    payload = {"model": model, "prompt": prompt, "stream": True, "keep_alive": OLLAMA_KEEP_ALIVE}
+    if format:
+        payload["format"] = format
+    with get_ollama_session().post(
+        OLLAMA_GENERATE_URL,
+        data=_dumps_bytes(payload),
+        timeout=timeout,
+        stream=True
+    ) as response:
+        if response.status_code != 200:
+            return
+        for line in response.iter_lines():
+            if stop_event is not None and stop_event.is_set():
+                break
+            if line:
+                chunk = json.loads(line)
+                yield chunk.get('response', '')
+                if chunk.get('done'):
+                    break
+
+def ollama_stream_cached(prompt, model="llama3", stop_event=None, format=None):
+    """Stream a response, replaying it from this session's cache if the same prompt already completed"""
+    cache = st.session_state.setdefault('ollama_responses', {})
+    key = (model, format, prompt)
+    if key in cache:
+        yield cache[key]
+        return
+    
+    parts = []
+    for chunk in ollama_stream(prompt, model=model, stop_event=stop_event, format=format):
+        parts.append(chunk)
+        yield chunk
+    
+    # Only complete answers are replayed; stopped or failed generations ask again next time
+    text = ''.join(parts)
+    if text and not (stop_event is not None and stop_event.is_set()):
+        if len(cache) >= OLLAMA_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = text
+
+def _save_generated_tool(tool_name, description, language, code, workspace_root, label, key):
+    """Render a save button for AI-generated code, storing it in the tools library or the workspace fallback"""
+    if not st.button(label, key=key):
+        return
+    
+    if st.session_state.tools_manager:
+        try:
+            st.session_state.tools_manager.create_tool(
+                name=tool_name,
+                description=description,
+                category="ai_generated",
+                language=language.lower(),
+                code=code
+            )
+            st.success(f"✅ Tool '{tool_name}' saved to library!")
+        except Exception as e:
+            st.error(f"❌ Save failed: {e}")
+    else:
+        future = save_tool_fallback(tool_name, code, language, workspace_root)
+        _report_fallback_save(future, tool_name)
+
+def _ollama_stop_button(key):
+    """Show a Stop button for the stream about to start and return the event it sets"""
+    stop_event = st.session_state.setdefault('ollama_stop', threading.Event())
+    stop_event.clear()
+    st.button("⏹ Stop", key=key, on_click=stop_event.set)
+    return stop_event
+
 def parse_ai_tool_response(ai_response, description):
     """Parse AI response to extract tool name, code, and usage"""
-    lines = ai_response.split('\n')
+    # JSON-mode responses carry the fields directly; anything else goes through the text parser
+    try:
+        data = json.loads(ai_response)
+    except ValueError:
+        data = None
+    if isinstance(data, dict) and data.get('code'):
+        words = description.split()[:3]
+        tool_name = str(data.get('name') or '').strip() or "_".join(w.lower() for w in words if w.isalpha())
+        return tool_name, str(data['code']), str(data.get('usage') or '')
     
     # Extract tool name (look for patterns)
-    tool_name = "ai_generated_tool"
-    for line in lines:
-        if "name:" in line.lower() or "tool:" in line.lower():
-            tool_name = line.split(':')[-1].strip()
-            break
+    name_match = AI_TOOL_NAME_RE.search(ai_response)
+    tool_name = name_match.group(0).split(':')[-1].strip() if name_match else "ai_generated_tool"
     
     # If no name found, generate from description
     if tool_name == "ai_generated_tool":
         words = description.split()[:3]
         tool_name = "_".join(w.lower() for w in words if w.isalpha())
     
-    # Extract code (look for code blocks)
-    code_start = -1
-    code_end = -1
-    
-    for i, line in enumerate(lines):
-        if '```' in line and code_start == -1:
-            code_start = i + 1
-        elif '```' in line and code_start != -1:
-            code_end = i
-            break
-    
-    if code_start != -1 and code_end != -1:
-        tool_code = '\n'.join(lines[code_start:code_end])
+    # Extract code (first code block) and usage info (text after it)
+    code_match = AI_CODE_BLOCK_RE.search(ai_response)
+    if code_match:
+        tool_code = code_match.group(1)
+        if tool_code.endswith('\n'):
+            tool_code = tool_code[:-1]
+        usage_info = ai_response[code_match.end() + 1:]
     else:
         # Fallback: use the whole response as code
         tool_code = ai_response
-    
-    # Extract usage info (text after code)
-    usage_info = ""
-    if code_end != -1 and code_end < len(lines) - 1:
-        usage_info = '\n'.join(lines[code_end+1:])
+        usage_info = ""
     
     return tool_name, tool_code, usage_info
 
-def execute_tool_code(code, language, workspace_root):
-    """Execute tool code safely and track for saving"""
+def execute_tool_code(code, language, workspace_root, on_output=None):
+    """Execute tool code safely and track for saving, passing the output so far to on_output while it runs"""
     try:
         if language.lower() == 'python':
-            # Create temporary file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(code)
-                temp_file = f.name
+            # Short code is passed with -c; code that needs __file__, or is too long for argv, runs from a temp file
+            temp_file = None
+            if len(code) > TOOL_INLINE_MAX_CHARS or '__file__' in code:
+                with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+                    f.write(code)
+                    temp_file = f.name
             
-            # Execute
-            result = subprocess.run(
-                ['python', temp_file],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=workspace_root
-            )
-            
-            # Cleanup
-            os.unlink(temp_file)
+            # Execute with -u so output streams while it runs; input() sees EOF instead of hanging
+            try:
+                process = subprocess.Popen(
+                    [sys.executable, '-u', temp_file] if temp_file else [sys.executable, '-u', '-c', code],
+                    cwd=workspace_root,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    bufsize=1
+                )
+                stdout, stderr = _collect_output(process, 30, on_output)
+            finally:
+                if temp_file:
+                    os.unlink(temp_file)
             
             execution_result = {
-                "success": result.returncode == 0,
-                "output": result.stdout,
-                "error": result.stderr
+                "success": process.returncode == 0,
+                "output": stdout,
+                "error": stderr
             }
             
             # Track successful executions for potential saving
             if execution_result["success"]:
                 if 'executed_tools_history' not in st.session_state:
-                    st.session_state['executed_tools_history'] = []
+                    st.session_state['executed_tools_history'] = deque(maxlen=10)
                 
-                # Add to history (keep last 10)
+                # Add to history (the deque keeps the last 10)
                 tool_execution = {
                     'name': f"executed_tool_{datetime.now().strftime('%H%M%S')}",
                     'code': code,
                     'language': language,
-                    'output': result.stdout,
+                    'output': stdout,
                     'timestamp': datetime.now().isoformat(),
                     'description': f"Executed {language} tool"
                 }
                 
                 st.session_state['executed_tools_history'].append(tool_execution)
-                if len(st.session_state['executed_tools_history']) > 10:
-                    st.session_state['executed_tools_history'].pop(0)
             
             return execution_result
         
@@ -1807,66 +2329,78 @@ def save_tool_fallback(name, code, language, workspace_root):
     ext = '.py' if language.lower() == 'python' else '.js' if language.lower() == 'javascript' else '.sh'
     file_path = os.path.join(tools_dir, f"{name}{ext}")
     
-    with open(file_path, 'w') as f:
-        f.write(f"#!/usr/bin/env {language.lower()}\n")
-        f.write(f"# Generated by AI on {datetime.now()}\n\n")
-        f.write(code)
-    
-    # Make executable
-    os.chmod(file_path, 0o755)
-
-def extract_tool_name(ai_response):
-    """Extract tool name from AI response"""
-    lines = ai_response.split('\n')
-    for line in lines:
-        if 'EXISTING_TOOL:' in line:
-            parts = line.split(':')
-            if len(parts) > 1:
-                return parts[1].strip().split()[0]
-    return None
-
-def extract_script_code(ai_response):
-    """Extract script code from AI response"""
-    lines = ai_response.split('\n')
-    code_lines = []
-    in_code = False
-    
-    for line in lines:
-        if 'NEW_SCRIPT:' in line:
-            in_code = True
+    header = f"#!/usr/bin/env {language.lower()}\n# Generated by AI on {datetime.now()}\n\n"
+    
+    # Written and made executable by the background writer, in order with any other queued writes
+    return get_background_writer().put(file_path, (header + code).encode('utf-8'), mode=0o755)
+
+def _report_fallback_save(future, tool_name):
+    """Show whether a fallback tool save finished, failed or is still being written"""
+    try:
+        future.result(timeout=SAVE_WAIT_SECONDS)
+    except FutureTimeoutError:
+        st.info(f"⏳ Tool '{tool_name}' is still being saved to workspace...")
+    except OSError as e:
+        st.error(f"❌ Save failed: {e}")
+    else:
+        st.success(f"✅ Tool '{tool_name}' saved to workspace!")
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _analyze_workspace_cached(workspace_root, root_mtime_ns):
+    """Count files by kind under the workspace; root_mtime_ns only keys the cache"""
+    analysis = {
+        "total_files": 0,
+        "python_files": 0,
+        "js_files": 0,
+        "directories": 0,
+        "recent_files": 0,
+        "approximate": False
+    }
+    
+    # Files modified after this count as recent (last 7 days)
+    cutoff = datetime.now().timestamp() - 7*24*3600
+    
+    # One scandir pass per directory; like os.walk, directory symlinks are counted but not entered
+    stack = [workspace_root]
+    while stack:
+        if analysis["total_files"] >= WORKSPACE_MAX_FILES:
+            analysis["approximate"] = True
+            break
+        # Unreadable or vanished directories are skipped rather than failing the whole scan
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
             continue
-        if in_code:
-            code_lines.append(line)
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Dependency, build and hidden directories (.git, .venv, caches) are left out entirely
+                    if entry.name in WORKSPACE_SKIP_DIRS or entry.name.startswith('.'):
+                        continue
+                    analysis["directories"] += 1
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                    continue
+                
+                analysis["total_files"] += 1
+                name = entry.name
+                dot = name.rfind('.')
+                bucket = WORKSPACE_FILE_BUCKETS.get(name[dot:]) if dot != -1 else None
+                if bucket:
+                    analysis[bucket] += 1
+                
+                if entry.stat(follow_symlinks=False).st_mtime > cutoff:
+                    analysis["recent_files"] += 1
     
-    return '\n'.join(code_lines).strip()
+    return analysis
 
 def analyze_workspace(workspace_root):
     """Analyze workspace for AI suggestions"""
     try:
-        analysis = {
-            "total_files": 0,
-            "python_files": 0,
-            "js_files": 0,
-            "directories": 0,
-            "recent_files": 0
-        }
-        
-        for root, dirs, files in os.walk(workspace_root):
-            analysis["directories"] += len(dirs)
-            analysis["total_files"] += len(files)
-            
-            for file in files:
-                if file.endswith('.py'):
-                    analysis["python_files"] += 1
-                elif file.endswith('.js'):
-                    analysis["js_files"] += 1
-                
-                # Check if recent (last 7 days)
-                file_path = os.path.join(root, file)
-                if os.path.getmtime(file_path) > (datetime.now().timestamp() - 7*24*3600):
-                    analysis["recent_files"] += 1
-        
-        return f"Workspace has {analysis['total_files']} files, {analysis['python_files']} Python files, {analysis['js_files']} JS files, {analysis['directories']} directories, {analysis['recent_files']} recently modified files"
+        # Cached for a minute, or until something directly inside the workspace changes
+        analysis = _analyze_workspace_cached(workspace_root, os.stat(workspace_root).st_mtime_ns)
+        more = "+" if analysis["approximate"] else ""
+        return f"Workspace has {analysis['total_files']}{more} files, {analysis['python_files']} Python files, {analysis['js_files']} JS files, {analysis['directories']} directories, {analysis['recent_files']} recently modified files"
     
     except:
         return "Unable to analyze workspace"
@@ -1979,25 +2513,24 @@ Your system includes specialized agents for:
         user_input = st.text_area("Message:", placeholder="Ask me about your projects...")
         
         if st.button("Send") and user_input:
-            with st.spinner("🤖 Thinking..."):
-                try:
-                    import requests
-                    response = requests.post(
-                        "http://localhost:11434/api/generate",
-                        json={"model": "llama3", "prompt": user_input, "stream": False},
-                        timeout=30
-                    )
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        st.markdown(f"**🧠 You:** {user_input}")
-                        st.markdown(f"**🤖 AI:** {result.get('response', 'No response')}")
-                    else:
-                        st.error("❌ AI service unavailable")
-                    
-                except Exception as e:
-                    st.error(f"❌ AI chat failed: {e}")
-                    st.info("💡 Make sure Ollama is running: `ollama serve`")
+            submit_ai_request('chat', user_input, timeout=30)
+            st.session_state['chat_prompt'] = user_input
+        
+        _await_ai_request('chat', "🤖 Thinking...")
+        finished = take_ai_result('chat')
+        if finished:
+            try:
+                reply = finished.result()
+                
+                if reply is not None:
+                    st.markdown(f"**🧠 You:** {st.session_state['chat_prompt']}")
+                    st.markdown(f"**🤖 AI:** {reply or 'No response'}")
+                else:
+                    st.error("❌ AI service unavailable")
+                
+            except Exception as e:
+                st.error(f"❌ AI chat failed: {e}")
+                st.info("💡 Make sure Ollama is running: `ollama serve`")
     
     elif page == "📊 Dashboard":
         st.title("📊 System Dashboard")